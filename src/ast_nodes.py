@@ -8,21 +8,22 @@ if TYPE_CHECKING:
 # Position classes
 # -----------------------------
 
-@dataclass
+@dataclass(slots=True)
 class SourcePos:
     line: int
     column: int
 
-@dataclass
+@dataclass(slots=True)
 class ASTNode:
     pos: SourcePos
 
 
-@dataclass
+@dataclass(slots=True)
 class Expr(ASTNode):
     inferred_type: Optional["Type"] = field(default=None, init=False)
 
 
+@dataclass(slots=True)
 class Stmt(ASTNode):
     pass
 
@@ -31,12 +32,12 @@ class Stmt(ASTNode):
 # Program structure
 # -----------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Program(ASTNode):
     functions: List["FunctionDef"]
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionDef(ASTNode):
     name: str
     params: List["Param"]
@@ -44,13 +45,13 @@ class FunctionDef(ASTNode):
     body: "Block"    
 
 
-@dataclass
+@dataclass(slots=True)
 class Param(ASTNode):
     type: str
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Block(Stmt):
     statements: List["Stmt"]
 
@@ -59,38 +60,38 @@ class Block(Stmt):
 # Statements
 # -----------------------------
 
-@dataclass
+@dataclass(slots=True)
 class VarDecl(Stmt):
     type: str
     name: str
     value: Optional["Expr"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Assign(Stmt):
     name: str
     value: "Expr"
 
 
-@dataclass
+@dataclass(slots=True)
 class IfStmt(Stmt):
     condition: "Expr"
     then_body: "Block"
     else_body: Optional["Block"]
 
 
-@dataclass
+@dataclass(slots=True)
 class WhileStmt(Stmt):
     condition: "Expr"
     body: "Block"
 
 
-@dataclass
+@dataclass(slots=True)
 class ReturnStmt(Stmt):
     value: "Expr"
 
 
-@dataclass
+@dataclass(slots=True)
 class PrintStmt(Stmt):
     value: "Expr"
 
@@ -99,30 +100,30 @@ class PrintStmt(Stmt):
 # Expressions
 # -----------------------------
 
-@dataclass
+@dataclass(slots=True)
 class BinaryExpr(Expr):
     left: "Expr"
     op: str
     right: "Expr"
 
 
-@dataclass
+@dataclass(slots=True)
 class UnaryExpr(Expr):
     op: str
     right: "Expr"
 
 
-@dataclass
+@dataclass(slots=True)
 class CallExpr(Expr):
     fname: str
     arguments: List["Expr"]
 
 
-@dataclass
+@dataclass(slots=True)
 class VarExpr(Expr):
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Literal(Expr):
     value: Union[int, bool]
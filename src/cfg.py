@@ -1,34 +1,72 @@
-from typing import List, Optional
+from typing import Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
 from ast_nodes import *
 
 
 class BasicBlock:
     def __init__(self, name: str):
         self.name = name
-        self.statements: List[Stmt] = []
-        self.out_edges: List["CFGEdge"] = []
-        self.in_edges: List["CFGEdge"] = []
+
+        # empty blocks share the empty tuple; a list is allocated
+        # on the first append
+        self.statements: Sequence[Stmt] = ()
+        self.out_edges: Sequence["CFGEdge"] = ()
+        self.in_edges: Sequence["CFGEdge"] = ()
+
+        # neighbour lists kept in sync with the edge lists
+        self._successors: Sequence["BasicBlock"] = ()
+        self._predecessors: Sequence["BasicBlock"] = ()
+
+        # built on first __repr__
+        self._repr: Optional[str] = None
+
+    def add_stmt(self, stmt: Stmt) -> None:
+        if self.statements:
+            self.statements.append(stmt)
+        else:
+            self.statements = [stmt]
 
     def add_out_edge(self, edge: "CFGEdge") -> None:
-        self.out_edges.append(edge)
+        if self.out_edges:
+            self.out_edges.append(edge)
+            self._successors.append(edge.dst)
+        else:
+            self.out_edges = [edge]
+            self._successors = [edge.dst]
 
     def add_in_edge(self, edge: "CFGEdge") -> None:
-        self.in_edges.append(edge)
+        if self.in_edges:
+            self.in_edges.append(edge)
+            self._predecessors.append(edge.src)
+        else:
+            self.in_edges = [edge]
+            self._predecessors = [edge.src]
+
+    def freeze(self) -> None:
+        """
+        Convert edge and neighbour lists to tuples once
+        construction is finished; no edges are added afterwards.
+        """
+        self.out_edges = tuple(self.out_edges)
+        self.in_edges = tuple(self.in_edges)
+        self._successors = tuple(self._successors)
+        self._predecessors = tuple(self._predecessors)
 
     # -------------------------
     # Convenience views
     # -------------------------
 
     @property
-    def predecessors(self) -> list["BasicBlock"]:
-        return [e.src for e in self.in_edges]
+    def predecessors(self) -> Sequence["BasicBlock"]:
+        return self._predecessors
 
     @property
-    def successors(self) -> list["BasicBlock"]:
-        return [e.dst for e in self.out_edges]
+    def successors(self) -> Sequence["BasicBlock"]:
+        return self._successors
 
     def __repr__(self):
-        return f"<BB {self.name}>"
+        if self._repr is None:
+            self._repr = f"<BB {self.name}>"
+        return self._repr
 
 
 class ControlFlowGraph:
@@ -37,12 +75,80 @@ class ControlFlowGraph:
         self.exit: Optional[BasicBlock] = None
         self.blocks: List[BasicBlock] = []
 
+        # set by CFGBuilder.build(); None for hand-assembled graphs
+        self.always_returns: Optional[bool] = None
+        self.reachable: Optional[FrozenSet[BasicBlock]] = None
+
+        # filled by cfg_analysis.annotate_cfg(): id(stmt) -> (reads, writes,
+        # kind), and every variable the statements mention, sorted
+        self.var_names: Tuple[str, ...] = ()
+        self.stmt_info: Optional[Dict[int, Tuple[FrozenSet[str], FrozenSet[str], int]]] = None
+
+        # cached by reverse_postorder() / adjacency()
+        self._rpo: Optional[Tuple[BasicBlock, ...]] = None
+        self._adjacency: Optional[
+            Tuple[Dict[BasicBlock, int], Tuple[Tuple[int, ...], ...], Tuple[Tuple[int, ...], ...]]
+        ] = None
+
+    def reverse_postorder(self) -> Tuple[BasicBlock, ...]:
+        """
+        Blocks reachable from entry in reverse postorder, followed by
+        any unreachable blocks in creation order. Computed once with
+        an iterative DFS; the CFG must be complete when first called.
+        """
+        if self._rpo is not None:
+            return self._rpo
+
+        entry = self.entry
+        assert entry is not None
+
+        order: List[BasicBlock] = []
+        visited: Set[BasicBlock] = {entry}
+        stack = [(entry, iter(entry.successors))]
+
+        while stack:
+            block, succs = stack[-1]
+            for succ in succs:
+                if succ not in visited:
+                    visited.add(succ)
+                    stack.append((succ, iter(succ.successors)))
+                    break
+            else:
+                stack.pop()
+                order.append(block)
+
+        order.reverse()
+        order.extend(b for b in self.blocks if b not in visited)
+
+        self._rpo = tuple(order)
+        return self._rpo
+
+    def adjacency(
+        self,
+    ) -> Tuple[Dict[BasicBlock, int], Tuple[Tuple[int, ...], ...], Tuple[Tuple[int, ...], ...]]:
+        """
+        (index, preds, succs): each block's position in self.blocks,
+        and per position the positions of its predecessors and
+        successors. Computed once; the CFG must be complete.
+        """
+        if self._adjacency is not None:
+            return self._adjacency
+
+        index = {b: i for i, b in enumerate(self.blocks)}
+        preds = tuple(tuple(index[p] for p in b.predecessors) for b in self.blocks)
+        succs = tuple(tuple(index[s] for s in b.successors) for b in self.blocks)
+
+        self._adjacency = (index, preds, succs)
+        return self._adjacency
+
     def new_block(self, name: str) -> BasicBlock:
         bb = BasicBlock(name)
         self.blocks.append(bb)
         return bb
 
 class CFGEdge:
+    __slots__ = ("src", "dst", "cond", "assume_true")
+
     def __init__(
         self,
         src: BasicBlock,
@@ -55,11 +161,27 @@ class CFGEdge:
         self.cond = cond
         self.assume_true = assume_true
 
+# statements that never split a basic block
+_SIMPLE_STMTS = frozenset({VarDecl, Assign, PrintStmt})
+
+
 class CFGBuilder:
     def __init__(self):
         self.cfg: Optional[ControlFlowGraph] = None
         self.block_id = 0
 
+        # blocks reachable from entry, tracked as edges are added
+        self._reached: Set[BasicBlock] = set()
+
+        # statement type -> builder, keyed on exact type; the
+        # _SIMPLE_STMTS are appended directly by _build_block
+        self._dispatch = {
+            ReturnStmt: self._build_return,
+            IfStmt: self._build_if,
+            WhileStmt: self._build_while,
+            Block: self._build_block,
+        }
+
     # -------------------------
     # Public entry
     # -------------------------
@@ -73,6 +195,7 @@ class CFGBuilder:
 
         entry = self._new_block("entry")
         self.cfg.entry = entry
+        self._reached = {entry}
 
         # function exit block
         exit_block = self._new_block("exit")
@@ -84,8 +207,26 @@ class CFGBuilder:
         if end is not None:
             self._connect(end, exit_block)
 
+        # the only edges into exit come from return blocks and from
+        # the fall-through end, so every path returns unless that
+        # fall-through is itself reachable
+        self.cfg.always_returns = end is None or end not in self._reached
+        self.cfg.reachable = frozenset(self._reached)
+
+        for b in self.cfg.blocks:
+            b.freeze()
+
         return self.cfg
 
+    def build_and_check(self, body: Block) -> Tuple[ControlFlowGraph, bool]:
+        """
+        Build CFG for a function body and report, from the same pass,
+        whether every path through it returns a value.
+        """
+        cfg = self.build(body)
+        assert cfg.always_returns is not None
+        return cfg, cfg.always_returns
+
     # -------------------------
     # Block / Statement builders
     # -------------------------
@@ -96,6 +237,11 @@ class CFGBuilder:
         Returns the block where control ends, or None if terminated.
         """
         for stmt in block.statements:
+            # straight-line statements just extend the current block
+            if type(stmt) in _SIMPLE_STMTS:
+                current.add_stmt(stmt)
+                continue
+
             next_block = self._build_stmt(stmt, current)
             if next_block is None:
                 return None
@@ -106,47 +252,20 @@ class CFGBuilder:
         """
         Dispatch based on statement kind.
         """
-        if isinstance(stmt, VarDecl):
-            return self._build_simple(stmt, current)
-
-        elif isinstance(stmt, Assign):
-            return self._build_simple(stmt, current)
-
-        elif isinstance(stmt, PrintStmt):
-            return self._build_simple(stmt, current)
-
-        elif isinstance(stmt, ReturnStmt):
-            return self._build_return(stmt, current)
-
-        elif isinstance(stmt, IfStmt):
-            return self._build_if(stmt, current)
-
-        elif isinstance(stmt, WhileStmt):
-            return self._build_while(stmt, current)
-
-        elif isinstance(stmt, Block):
-            return self._build_block(stmt, current)
-
-        else:
+        handler = self._dispatch.get(type(stmt))
+        if handler is None:
             raise RuntimeError(f"Unhandled stmt type in CFGBuilder: {type(stmt)}")
+        return handler(stmt, current)
 
     # -------------------------
     # Concrete builders
     # -------------------------
 
-    def _build_simple(self, stmt: Stmt, current: BasicBlock) -> BasicBlock:
-        """
-        For VarDecl / Assign / Print.
-        Just add stmt to current block.
-        """
-        current.statements.append(stmt)
-        return current
-
     def _build_return(self, stmt: ReturnStmt, current: BasicBlock) -> Optional[BasicBlock]:
         """
         Return terminates the current block.
         """
-        current.statements.append(stmt)
+        current.add_stmt(stmt)
 
         # connect this return directly to the function exit
         assert self.cfg is not None and self.cfg.exit is not None
@@ -158,7 +277,7 @@ class CFGBuilder:
 
     def _build_if(self, stmt: IfStmt, current: BasicBlock) -> Optional[BasicBlock]:
         # record the if statement in current block
-        current.statements.append(stmt)
+        current.add_stmt(stmt)
 
         assert self.cfg is not None
 
@@ -208,7 +327,7 @@ class CFGBuilder:
         self._connect(current, cond_block)
 
         # record the while statement in the condition block
-        cond_block.statements.append(stmt)
+        cond_block.add_stmt(stmt)
 
         # true branch → body
         self._connect(cond_block, body_block, cond = stmt.condition, assume_true = True)
@@ -246,3 +365,10 @@ class CFGBuilder:
         edge = CFGEdge(src, dst, cond, assume_true)
         src.add_out_edge(edge)
         dst.add_in_edge(edge)
+
+        # structured control flow adds every edge into a block before
+        # any edge out of it (a loop back edge comes from the body,
+        # which is only reachable through the condition block), so
+        # forward propagation here is exact
+        if src in self._reached:
+            self._reached.add(dst)
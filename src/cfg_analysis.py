@@ -1,5 +1,6 @@
-from typing import Dict, Set
-from enum import Enum
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Set, Tuple
+from collections import deque
+from enum import IntEnum
 from cfg import ControlFlowGraph, BasicBlock
 from ast_nodes import *
 from semantic import SemanticError
@@ -15,163 +16,265 @@ class CFGReturnAnalyzer:
     def function_always_returns(self) -> bool:
         """
         Returns True if every path returns a value.
+        Decided by CFGBuilder while the CFG was built, so the CFG
+        must come from CFGBuilder.build().
         """
-        entry = self.cfg.entry
-        exit = self.cfg.exit
+        if self.cfg.always_returns is None:
+            raise ValueError("CFG was not built by CFGBuilder.build()")
+        return self.cfg.always_returns
+
+class CFGUnreachableAnalyzer:
+    def __init__(self, cfg: ControlFlowGraph):
+        self.cfg = cfg
 
-        assert entry is not None and exit is not None
+    def reachable_blocks(self) -> Set[BasicBlock]:
+        # already recorded while the CFG was built
+        if self.cfg.reachable is not None:
+            return set(self.cfg.reachable)
 
-        return_blocks = self._find_return_blocks()
+        entry = self.cfg.entry
+        assert entry is not None
 
-        # DFS from entry, avoiding return blocks
         visited: Set[BasicBlock] = set()
-        can_reach_exit = self._dfs_can_reach_exit(
-            entry, exit, return_blocks, visited
-        )
+        stack = [entry]
 
-        # if exit is reachable without hitting return → bad
-        return not can_reach_exit
+        while stack:
+            block = stack.pop()
+            if block in visited:
+                continue
+            visited.add(block)
+            stack.extend(block.successors)
 
-    # -------------------------
-    # Helpers
-    # -------------------------
+        return visited
 
-    def _find_return_blocks(self) -> Set[BasicBlock]:
-        """
-        Collect all blocks that contain a return statement.
-        """
+    def unreachable_blocks(self) -> Set[BasicBlock]:
+        reachable = self.reachable_blocks()
+        return set(self.cfg.blocks) - reachable
+
+# -------------------------
+# Statement access table
+# -------------------------
+
+# statement kinds recorded by annotate_cfg()
+KIND_OTHER = 0
+KIND_VAR_DECL = 1
+KIND_ASSIGN = 2
+KIND_PRINT = 3
+KIND_RETURN = 4
+KIND_IF = 5
+KIND_WHILE = 6
+
+_STMT_KINDS = {
+    VarDecl: KIND_VAR_DECL,
+    Assign: KIND_ASSIGN,
+    PrintStmt: KIND_PRINT,
+    ReturnStmt: KIND_RETURN,
+    IfStmt: KIND_IF,
+    WhileStmt: KIND_WHILE,
+}
+
+# (variables read, variables written, kind)
+StmtInfo = Tuple[FrozenSet[str], FrozenSet[str], int]
+
+_NO_VARS: FrozenSet[str] = frozenset()
+
+
+def vars_read_in_expr(expr) -> Set[str]:
+    if isinstance(expr, VarExpr):
+        return {expr.name}
+
+    if isinstance(expr, Literal):
+        return set()
+
+    if isinstance(expr, UnaryExpr):
+        return vars_read_in_expr(expr.right)
+
+    if isinstance(expr, BinaryExpr):
+        return vars_read_in_expr(expr.left) | vars_read_in_expr(expr.right)
+
+    if isinstance(expr, CallExpr):
         result = set()
-        for b in self.cfg.blocks:
-            if self._is_return_block(b):
-                result.add(b)
+        for arg in expr.arguments:
+            result |= vars_read_in_expr(arg)
         return result
 
-    def _is_return_block(self, block: BasicBlock) -> bool:
-        if not block.statements:
-            return False
-        return isinstance(block.statements[-1], ReturnStmt)
+    return set()
 
-    def _dfs_can_reach_exit(
-        self,
-        current: BasicBlock,
-        exit: BasicBlock,
-        return_blocks: Set[BasicBlock],
-        visited: Set[BasicBlock],
-    ) -> bool:
 
-        # reached exit without hitting return
-        if current == exit:
-            return True
+def classify_stmt(stmt) -> StmtInfo:
+    kind = _STMT_KINDS.get(type(stmt), KIND_OTHER)
 
-        if current in visited:
-            return False
+    if kind == KIND_ASSIGN:
+        return frozenset(vars_read_in_expr(stmt.value)), frozenset((stmt.name,)), kind
 
-        visited.add(current)
+    if kind == KIND_VAR_DECL:
+        if stmt.value is None:
+            return _NO_VARS, _NO_VARS, kind
+        return frozenset(vars_read_in_expr(stmt.value)), frozenset((stmt.name,)), kind
 
-        # stop search at return blocks
-        if current in return_blocks:
-            return False
+    if kind == KIND_PRINT:
+        return frozenset(vars_read_in_expr(stmt.value)), _NO_VARS, kind
 
-        for succ in current.successors:
-            if self._dfs_can_reach_exit(succ, exit, return_blocks, visited):
-                return True
+    if kind == KIND_RETURN:
+        if stmt.value is None:
+            return _NO_VARS, _NO_VARS, kind
+        return frozenset(vars_read_in_expr(stmt.value)), _NO_VARS, kind
 
-        return False
+    if kind == KIND_IF or kind == KIND_WHILE:
+        return frozenset(vars_read_in_expr(stmt.condition)), _NO_VARS, kind
 
-class CFGUnreachableAnalyzer:
-    def __init__(self, cfg: ControlFlowGraph):
-        self.cfg = cfg
+    return _NO_VARS, _NO_VARS, kind
 
-    def reachable_blocks(self) -> Set[BasicBlock]:
-        entry = self.cfg.entry
-        assert entry is not None
 
-        visited: Set[BasicBlock] = set()
-        self._dfs(entry, visited)
-        return visited
+def annotate_cfg(cfg: ControlFlowGraph) -> Dict[int, StmtInfo]:
+    """
+    Classify every statement in the CFG once and record it in
+    cfg.stmt_info, shared by all analyzers run on the same graph.
+    """
+    if cfg.stmt_info is not None:
+        return cfg.stmt_info
 
-    def unreachable_blocks(self) -> Set[BasicBlock]:
-        reachable = self.reachable_blocks()
-        return set(self.cfg.blocks) - reachable
+    info: Dict[int, StmtInfo] = {}
+    names: Set[str] = set()
+    for b in cfg.blocks:
+        for stmt in b.statements:
+            reads, writes, kind = info[id(stmt)] = classify_stmt(stmt)
+            names |= reads
+            names |= writes
+            if kind == KIND_VAR_DECL:
+                names.add(stmt.name)
 
-    def _dfs(self, block: BasicBlock, visited: Set[BasicBlock]):
-        if block in visited:
-            return
-        visited.add(block)
-        for succ in block.successors:
-            self._dfs(succ, visited)
+    cfg.var_names = tuple(sorted(names))
+    cfg.stmt_info = info
+    return info
 
-class CFGVarAccessHelper:
-    def vars_read_in_expr(self, expr) -> set[str]:
-        if isinstance(expr, VarExpr):
-            return {expr.name}
 
-        if isinstance(expr, Literal):
-            return set()
+class CFGVarAccessHelper:
+    def __init__(self, cfg: ControlFlowGraph):
+        self.cfg = cfg
+        self._stmt_info = annotate_cfg(cfg)
 
-        if isinstance(expr, UnaryExpr):
-            return self.vars_read_in_expr(expr.right)
+    def vars_read_in_expr(self, expr) -> set[str]:
+        return vars_read_in_expr(expr)
 
-        if isinstance(expr, BinaryExpr):
-            return (
-                self.vars_read_in_expr(expr.left)
-                | self.vars_read_in_expr(expr.right)
-            )
+    def stmt_info(self, stmt) -> StmtInfo:
+        info = self._stmt_info.get(id(stmt))
+        if info is None:
+            # statement outside the CFG
+            info = classify_stmt(stmt)
+        return info
 
-        if isinstance(expr, CallExpr):
-            result = set()
-            for arg in expr.arguments:
-                result |= self.vars_read_in_expr(arg)
-            return result
+    def vars_read_in_stmt(self, stmt) -> FrozenSet[str]:
+        return self.stmt_info(stmt)[0]
 
-        return set()
+    def vars_written_in_stmt(self, stmt) -> FrozenSet[str]:
+        return self.stmt_info(stmt)[1]
 
-    def vars_read_in_stmt(self, stmt) -> set[str]:
-        if isinstance(stmt, Assign):
-            return self.vars_read_in_expr(stmt.value)
+    # -------------------------
+    # Bit-vector encoding of variable sets
+    # -------------------------
 
-        if isinstance(stmt, VarDecl):
-            if stmt.value is None:
-                return set()
-            return self.vars_read_in_expr(stmt.value)
+    def _index_variables(self, cfg: ControlFlowGraph, extra=()) -> Dict[str, int]:
+        """
+        Give every variable mentioned in the CFG (plus extra names)
+        a dense integer index.
+        """
+        annotate_cfg(cfg)
+        names = cfg.var_names
+        if extra:
+            names = sorted(set(names).union(extra))
 
-        if isinstance(stmt, PrintStmt):
-            return self.vars_read_in_expr(stmt.value)
+        return {name: i for i, name in enumerate(names)}
 
-        if isinstance(stmt, ReturnStmt):
-            if stmt.value is None:
-                return set()
-            return self.vars_read_in_expr(stmt.value)
+    def _number_variables(self, cfg: ControlFlowGraph, extra=()) -> Dict[str, int]:
+        """
+        Give every variable its own bit, so that variable sets
+        can be stored as ints.
+        """
+        return {
+            name: 1 << i
+            for name, i in self._index_variables(cfg, extra).items()
+        }
 
-        if isinstance(stmt, IfStmt):
-            return self.vars_read_in_expr(stmt.condition)
+    @staticmethod
+    def _mask(bit: Dict[str, int], names) -> int:
+        """
+        Combine the bits of names, as numbered by _number_variables().
+        """
+        result = 0
+        for name in names:
+            result |= bit[name]
+        return result
 
-        if isinstance(stmt, WhileStmt):
-            return self.vars_read_in_expr(stmt.condition)
+# -------------------------
+# Rules shared with the single-return fast path
+# -------------------------
+
+_UNASSIGNED_MSG = "Variable '{}' may be unassigned"
+_DIV_ZERO_MSG = "Possible division by zero"
+
+def unassigned_reads(reads: Iterable[Tuple[str, int]], assigned: int) -> Iterator[str]:
+    """
+    Names among reads, (name, bit) pairs, whose bit is not set in the
+    mask of definitely-assigned variables.
+    """
+    for var, bit in reads:
+        if not assigned & bit:
+            yield var
+
+
+def divisions_by_variable(expr: Expr) -> Iterator[Tuple[BinaryExpr, str]]:
+    """
+    Each `/` in expr whose divisor is a plain variable, with that
+    variable's name, in source order. Pre-order walk with an explicit
+    stack (children pushed right-to-left).
+    """
+    stack = [expr]
+
+    while stack:
+        node = stack.pop()
+
+        if isinstance(node, BinaryExpr):
+            if node.op == "/":
+                rhs = node.right
+                if isinstance(rhs, VarExpr):
+                    yield node, rhs.name
 
-        return set()
+            stack.append(node.right)
+            stack.append(node.left)
 
-    def vars_written_in_stmt(self, stmt) -> set[str]:
-        if isinstance(stmt, Assign):
-            return {stmt.name}
+        elif isinstance(node, UnaryExpr):
+            stack.append(node.right)
 
-        if isinstance(stmt, VarDecl) and stmt.value is not None:
-            return {stmt.name}
+        elif isinstance(node, CallExpr):
+            stack.extend(reversed(node.arguments))
 
-        return set()
 
 class CFGDefiniteAssignmentAnalyzer(CFGVarAccessHelper):
     def __init__(self, cfg: ControlFlowGraph, params):
-        self.cfg = cfg
+        super().__init__(cfg)
         self.params = {p.name for p in params}
 
-        self.IN: Dict[BasicBlock, Set[str]] = {}
-        self.OUT: Dict[BasicBlock, Set[str]] = {}
-        self.errors: List[SemanticError] = []
+        # variable name -> bit; IN/OUT/gen are masks over these bits
+        self._bit: Dict[str, int] = {}
+        self.gen: Dict[BasicBlock, int] = {}
+
+        # id(stmt) -> ((var, bit) read..., mask written)
+        self._stmt_access: Dict[int, Tuple[Tuple[Tuple[str, int], ...], int]] = {}
+
+        self.IN: Dict[BasicBlock, int] = {}
+        self.OUT: Dict[BasicBlock, int] = {}
+
+        # (message, node); turned into SemanticErrors by the errors property
+        self._errors: List[Tuple[str, ASTNode]] = []
     # -------------------------
     # Public API
     # -------------------------
 
+    @property
+    def errors(self) -> List[SemanticError]:
+        return [SemanticError(msg, node) for msg, node in self._errors]
+
     def analyze(self):
         """
         Compute IN/OUT sets for all blocks.
@@ -180,66 +283,90 @@ class CFGDefiniteAssignmentAnalyzer(CFGVarAccessHelper):
         self._fixed_point()
 
     def is_definitely_assigned(self, block: BasicBlock, name: str) -> bool:
-        return name in self.IN[block]
+        return bool(self.IN[block] & self._bit.get(name, 0))
 
     # -------------------------
     # Core algorithm
     # -------------------------
 
     def _initialize(self):
-        all_vars = self._collect_all_variables()
+        self._bit = bit = self._number_variables(self.cfg, self.params)
+
+        all_vars = self._mask(bit, self._collect_all_variables())
+        params = self._mask(bit, self.params)
+
+        # OUT starts at "everything assigned" so the iteration only
+        # removes facts and settles on the same (greatest) solution
+        # whatever order blocks are visited in
+        everything = (1 << len(bit)) - 1
 
         for b in self.cfg.blocks:
+            gen = 0
+            for stmt in b.statements:
+                reads = tuple(
+                    (var, bit[var]) for var in self.vars_read_in_stmt(stmt)
+                )
+                writes = self._mask(bit, self.vars_written_in_stmt(stmt))
+                self._stmt_access[id(stmt)] = (reads, writes)
+                gen |= writes
+
+            self.gen[b] = gen
             if b == self.cfg.entry:
-                self.IN[b] = set(self.params)
+                self.IN[b] = params
             else:
-                self.IN[b] = set(all_vars)
-            self.OUT[b] = set()
+                self.IN[b] = all_vars
+            self.OUT[b] = everything
 
     def _fixed_point(self):
-        changed = True
-        while changed:
-            changed = False
-            for b in self.cfg.blocks:
-                new_in = self._compute_in(b)
-                new_out = self._compute_out(b, new_in)
-
-                if new_in != self.IN[b] or new_out != self.OUT[b]:
-                    self.IN[b] = new_in
-                    self.OUT[b] = new_out
-                    changed = True
+        # iterate over block positions; IN/OUT are copied into lists
+        # for the loop and written back once it converges
+        blocks = self.cfg.blocks
+        index, preds, succs = self.cfg.adjacency()
+
+        IN = [self.IN[b] for b in blocks]
+        OUT = [self.OUT[b] for b in blocks]
+        gen = [self.gen[b] for b in blocks]
+
+        worklist = deque(index[b] for b in self.cfg.reverse_postorder())
+        queued = [True] * len(blocks)
+
+        while worklist:
+            i = worklist.popleft()
+            queued[i] = False
+
+            # IN = intersection of predecessor OUTs
+            # (blocks without predecessors keep their initial IN)
+            p = preds[i]
+            if p:
+                new_in = OUT[p[0]]
+                for j in p[1:]:
+                    new_in &= OUT[j]
+                IN[i] = new_in
+            else:
+                new_in = IN[i]
+
+            new_out = new_in | gen[i]
+            if new_out != OUT[i]:
+                OUT[i] = new_out
+                for j in succs[i]:
+                    if not queued[j]:
+                        queued[j] = True
+                        worklist.append(j)
+
+        for i, b in enumerate(blocks):
+            self.IN[b] = IN[i]
+            self.OUT[b] = OUT[i]
 
     # -------------------------
     # Helpers
     # -------------------------
 
-    def _compute_in(self, block: BasicBlock) -> Set[str]:
-        if not block.predecessors:
-            return self.IN[block]
-
-        result = self.OUT[block.predecessors[0]].copy()
-        for p in block.predecessors[1:]:
-            result &= self.OUT[p]
-        return result
-
-    def _compute_out(self, block: BasicBlock, in_set: Set[str]) -> Set[str]:
-        assigned = self._assigned_in_block(block)
-        return in_set | assigned
-
-    def _assigned_in_block(self, block: BasicBlock) -> Set[str]:
-        result = set()
-        for stmt in block.statements:
-            if isinstance(stmt, Assign):
-                result.add(stmt.name)
-            elif isinstance(stmt, VarDecl) and stmt.value is not None:
-                result.add(stmt.name)
-        return result
-
     def _collect_all_variables(self) -> Set[str]:
         result = set()
+        info = self._stmt_info
         for b in self.cfg.blocks:
             for stmt in b.statements:
-                if isinstance(stmt, VarDecl):
+                if info[id(stmt)][2] == KIND_VAR_DECL:
                     result.add(stmt.name)
         return result
     # -------------------------
@@ -251,28 +378,32 @@ class CFGDefiniteAssignmentAnalyzer(CFGVarAccessHelper):
         Must be called AFTER analyze() so IN sets are available.
         error_callback(msg: str, node: ASTNode)
         """
+        access = self._stmt_access
+
         for block in self.cfg.blocks:
-            assigned = self.IN[block].copy()
+            assigned = self.IN[block]
 
             for stmt in block.statements:
+                reads, writes = access[id(stmt)]
+
                 # check reads
-                for var in self.vars_read_in_stmt(stmt):
-                    if var not in assigned:
-                        self.errors.append(
-                            SemanticError(
-                                f"Variable '{var}' may be unassigned",
-                                stmt
-                            )
-                        )
+                for var in unassigned_reads(reads, assigned):
+                    self._errors.append((_UNASSIGNED_MSG.format(var), stmt))
 
                 # apply writes
-                assigned |= self.vars_written_in_stmt(stmt)
+                assigned |= writes
 
 class CFGDeadStoreAnalyzer(CFGVarAccessHelper):
     def __init__(self, cfg):
-        self.cfg: ControlFlowGraph = cfg
-        self.IN: Dict[BasicBlock, Set[str]] = {}
-        self.OUT: Dict[BasicBlock, Set[str]] = {}
+        super().__init__(cfg)
+
+        # variable name -> bit; IN/OUT/gen/kill are masks over these bits
+        self._bit: Dict[str, int] = {}
+        self.gen: Dict[BasicBlock, int] = {}
+        self.kill: Dict[BasicBlock, int] = {}
+
+        self.IN: Dict[BasicBlock, int] = {}
+        self.OUT: Dict[BasicBlock, int] = {}
         self.dead_stores: List[ASTNode] = []
 
     def analyze(self):
@@ -281,84 +412,132 @@ class CFGDeadStoreAnalyzer(CFGVarAccessHelper):
         self._collect_dead_stores()
 
     def _initialize(self):
-        for b in self.cfg.blocks:
-            self.IN[b] = set()
-            self.OUT[b] = set()
+        self._bit = self._number_variables(self.cfg)
 
-    def _fixed_point(self):
-        changed = True
-        while changed:
-            changed = False
-            for b in reversed(self.cfg.blocks):
-                new_out = set()
-                for succ in b.successors:
-                    new_out |= self.IN[succ]
-
-                new_in = self._compute_in(b, new_out)
-
-                if new_in != self.IN[b] or new_out != self.OUT[b]:
-                    self.IN[b] = new_in
-                    self.OUT[b] = new_out
-                    changed = True
+        for b in self.cfg.blocks:
+            self.gen[b], self.kill[b] = self._block_gen_kill(b)
+            self.IN[b] = 0
+            self.OUT[b] = 0
 
-    def _compute_in(self, block, out_set):
-        live = out_set.copy()
+    def _block_gen_kill(self, block):
+        """
+        Fold the block's statements, last to first, into a single
+        transfer IN = (OUT & ~kill) | gen.
+        """
+        bit = self._bit
+        gen = 0
+        kill = 0
 
         for stmt in reversed(block.statements):
-            # kill
-            for var in self.vars_written_in_stmt(stmt):
-                live.discard(var)
+            written = self._mask(bit, self.vars_written_in_stmt(stmt))
+            read = self._mask(bit, self.vars_read_in_stmt(stmt))
 
-            # gen
-            for var in self.vars_read_in_stmt(stmt):
-                live.add(var)
+            kill |= written
+            gen = (gen & ~written) | read
 
-        return live
+        return gen, kill
+
+    def _fixed_point(self):
+        # backward analysis: visit in postorder, propagate to predecessors
+        blocks = self.cfg.blocks
+        index, preds, succs = self.cfg.adjacency()
+
+        IN = [0] * len(blocks)
+        OUT = [0] * len(blocks)
+        gen = [self.gen[b] for b in blocks]
+        kill = [self.kill[b] for b in blocks]
+
+        worklist = deque(index[b] for b in reversed(self.cfg.reverse_postorder()))
+        queued = [True] * len(blocks)
+
+        while worklist:
+            i = worklist.popleft()
+            queued[i] = False
+
+            new_out = 0
+            for j in succs[i]:
+                new_out |= IN[j]
+            OUT[i] = new_out
+
+            new_in = (new_out & ~kill[i]) | gen[i]
+            if new_in != IN[i]:
+                IN[i] = new_in
+                for j in preds[i]:
+                    if not queued[j]:
+                        queued[j] = True
+                        worklist.append(j)
+
+        for i, b in enumerate(blocks):
+            self.IN[b] = IN[i]
+            self.OUT[b] = OUT[i]
 
     def _collect_dead_stores(self):
+        bit = self._bit
+
         for block in self.cfg.blocks:
-            live = self.OUT[block].copy()
+            live = self.OUT[block]
 
             for stmt in reversed(block.statements):
                 written = self.vars_written_in_stmt(stmt)
                 read = self.vars_read_in_stmt(stmt)
 
                 for var in written:
-                    if var not in live:
+                    if not live & bit[var]:
                         self.dead_stores.append(stmt)
 
                 # update liveness
-                live -= written
-                live |= read
+                live &= ~self._mask(bit, written)
+                live |= self._mask(bit, read)
 
-class ZeroState(Enum):
+class ZeroState(IntEnum):
     ZERO = 0
     NONZERO = 1
     UNKNOWN = 2
 
-# Abstract state: variable -> zero information
-State = Dict[str, ZeroState]
+# Abstract state: one byte per variable (indexed via CFGZeroAnalysis._vidx)
+# holding a ZeroState value
+State = bytearray
+
+_ZERO = ZeroState.ZERO
+_NONZERO = ZeroState.NONZERO
+_UNKNOWN = ZeroState.UNKNOWN
 
 
+_VALUE_KINDS = frozenset({KIND_ASSIGN, KIND_VAR_DECL, KIND_PRINT, KIND_RETURN})
+
 class CFGZeroAnalysis(CFGVarAccessHelper):
     def __init__(self, cfg: ControlFlowGraph):
-        self.cfg: ControlFlowGraph = cfg
+        super().__init__(cfg)
+
+        # variable name -> index into a State
+        self._vidx: Dict[str, int] = {}
+
+        # reused buffer for refining a predecessor's OUT along an edge
+        self._scratch: State = bytearray()
 
         # block -> abstract state
         self.IN: Dict[BasicBlock, State] = {}
         self.OUT: Dict[BasicBlock, State] = {}
 
-        self.errors: list[SemanticError] = []
+        # (message, node); turned into SemanticErrors by the errors property
+        self._errors: List[Tuple[str, ASTNode]] = []
+
+    @property
+    def errors(self) -> List[SemanticError]:
+        return [SemanticError(msg, node) for msg, node in self._errors]
 
     # -------------------------
     # Initialization
     # -------------------------
 
     def _initial_state(self) -> State:
-        # empty dict means: all variables UNKNOWN
-        return {}
+        # all variables UNKNOWN
+        return bytearray([_UNKNOWN]) * len(self._vidx)
 
     def _initialize(self) -> None:
+        self._vidx = self._index_variables(self.cfg)
+        self._scratch = self._initial_state()
+
         for b in self.cfg.blocks:
             self.IN[b] = self._initial_state()
             self.OUT[b] = self._initial_state()
@@ -370,21 +549,32 @@ class CFGZeroAnalysis(CFGVarAccessHelper):
     def analyze(self) -> None:
         self._initialize()
 
-        changed: bool = True
-        while changed:
-            changed = False
+        blocks = self.cfg.blocks
+        index, _, succs = self.cfg.adjacency()
 
-            for b in self.cfg.blocks:
-                in_state: State = self._compute_in(b)
-                out_state: State = self._transfer_block(b, in_state)
+        worklist = deque(index[b] for b in self.cfg.reverse_postorder())
+        queued = [True] * len(blocks)
 
-                if in_state != self.IN[b] or out_state != self.OUT[b]:
-                    self.IN[b] = in_state
-                    self.OUT[b] = out_state
-                    changed = True
+        while worklist:
+            i = worklist.popleft()
+            queued[i] = False
+            b = blocks[i]
+
+            # states are looked up per edge (edges carry the branch
+            # condition used for refinement), so IN/OUT stay keyed by block
+            in_state: State = self._compute_in(b)
+            out_state: State = self._transfer_block(b, in_state)
+            self.IN[b] = in_state
+
+            if out_state != self.OUT[b]:
+                self.OUT[b] = out_state
+                for j in succs[i]:
+                    if not queued[j]:
+                        queued[j] = True
+                        worklist.append(j)
 
         for b in self.cfg.blocks:
-            state = dict(self.IN[b])
+            state = bytearray(self.IN[b])
             for stmt in b.statements:
                 self._check_stmt(stmt, state)
                 self._apply_stmt(stmt, state)
@@ -394,30 +584,35 @@ class CFGZeroAnalysis(CFGVarAccessHelper):
     # -------------------------
 
     def _compute_in(self, block: BasicBlock) -> State:
+        # States are never mutated once stored in IN/OUT, so
+        # unconditional edges read the predecessor's OUT directly;
+        # only refined edges go through the shared scratch buffer.
         state: State | None = None
+        scratch = self._scratch
 
         for edge in block.in_edges:
-            pred_state: State = dict(self.OUT[edge.src])
+            pred_state: State = self.OUT[edge.src]
 
             if edge.cond is not None:
                 assert edge.assume_true is not None
+                scratch[:] = pred_state
                 pred_state = self.refine_on_condition(
                     edge.cond,
                     edge.assume_true,
-                    pred_state
+                    scratch
                 )
 
             if state is None:
-                state = pred_state
+                state = bytearray(scratch) if pred_state is scratch else pred_state
             else:
                 state = self._join_states(state, pred_state)
 
-        return state if state is not None else {}
+        return state if state is not None else self._initial_state()
 
 
     def _transfer_block(self, block: BasicBlock, state: State) -> State:
         # copy because we mutate locally
-        cur: State = dict(state)
+        cur: State = bytearray(state)
 
         for stmt in block.statements:
             self._apply_stmt(stmt, cur)
@@ -429,28 +624,37 @@ class CFGZeroAnalysis(CFGVarAccessHelper):
     # -------------------------
 
     def _apply_stmt(self, stmt: Stmt, state: State) -> None:
-        if isinstance(stmt, Assign):
-            state[stmt.name] = self._eval_expr(stmt.value, state)
+        handler = self._STMT_EFFECTS.get(self._stmt_info[id(stmt)][2])
+        if handler is not None:
+            handler(self, stmt, state)
 
-        elif isinstance(stmt, VarDecl):
-            if stmt.value is not None:
-                state[stmt.name] = self._eval_expr(stmt.value, state)
-            else:
-                state[stmt.name] = ZeroState.UNKNOWN
+    def _apply_assign(self, stmt: Assign, state: State) -> None:
+        state[self._vidx[stmt.name]] = self._eval_expr(stmt.value, state)
+
+    def _apply_var_decl(self, stmt: VarDecl, state: State) -> None:
+        if stmt.value is not None:
+            state[self._vidx[stmt.name]] = self._eval_expr(stmt.value, state)
+        else:
+            state[self._vidx[stmt.name]] = _UNKNOWN
 
-    def _eval_expr(self, expr: Expr, state: State) -> ZeroState:
+    _STMT_EFFECTS = {
+        KIND_ASSIGN: _apply_assign,
+        KIND_VAR_DECL: _apply_var_decl,
+    }
+
+    def _eval_expr(self, expr: Expr, state: State) -> int:
         if isinstance(expr, Literal):
             return (
-                ZeroState.ZERO
+                _ZERO
                 if isinstance(expr.value, int) and expr.value == 0
-                else ZeroState.NONZERO
+                else _NONZERO
             )
 
         if isinstance(expr, VarExpr):
-            return state.get(expr.name, ZeroState.UNKNOWN)
+            return state[self._vidx[expr.name]]
 
         # conservative default
-        return ZeroState.UNKNOWN
+        return _UNKNOWN
 
     # -------------------------
     # Condition refinement
@@ -465,16 +669,16 @@ class CFGZeroAnalysis(CFGVarAccessHelper):
         new_state: State = state
 
         if isinstance(cond, VarExpr):
-            new_state[cond.name] = (
-                ZeroState.NONZERO if assume_true else ZeroState.ZERO
+            new_state[self._vidx[cond.name]] = (
+                _NONZERO if assume_true else _ZERO
             )
             return new_state
 
         if isinstance(cond, UnaryExpr) and cond.op == "!":
             inner = cond.right
             if isinstance(inner, VarExpr):
-                new_state[inner.name] = (
-                    ZeroState.ZERO if assume_true else ZeroState.NONZERO
+                new_state[self._vidx[inner.name]] = (
+                    _ZERO if assume_true else _NONZERO
                 )
                 return new_state
 
@@ -486,60 +690,64 @@ class CFGZeroAnalysis(CFGVarAccessHelper):
     # -------------------------
 
     def _join_states(self, a: State, b: State) -> State:
-        result: State = {}
-
-        keys = set(a.keys()) | set(b.keys())
-        for k in keys:
-            va: ZeroState = a.get(k, ZeroState.UNKNOWN)
-            vb: ZeroState = b.get(k, ZeroState.UNKNOWN)
-
-            if va == vb:
-                result[k] = va
-            else:
-                result[k] = ZeroState.UNKNOWN
+        if a == b:
+            return a
 
-        return result
+        return bytearray(
+            va if va == vb else _UNKNOWN
+            for va, vb in zip(a, b)
+        )
 
     # -------------------------
     # Diagnostics
     # -------------------------
 
     def _check_stmt(self, stmt: Stmt, state: State) -> None:
-        if isinstance(stmt, Assign):
+        # only statements carrying a value expression can divide
+        if self._stmt_info[id(stmt)][2] in _VALUE_KINDS and stmt.value is not None:
             self._check_expr(stmt.value, state)
 
-        elif isinstance(stmt, VarDecl):
-            if stmt.value is not None:
-                self._check_expr(stmt.value, state)
-
-        elif isinstance(stmt, PrintStmt):
-            self._check_expr(stmt.value, state)
-
-        elif isinstance(stmt, ReturnStmt):
-            if stmt.value is not None:
-                self._check_expr(stmt.value, state)
-
     def _check_expr(self, expr: Expr, state: State) -> None:
-        if isinstance(expr, BinaryExpr):
-            if expr.op == "/":
-                rhs: Expr = expr.right
-                if isinstance(rhs, VarExpr):
-                    v: str = rhs.name
-                    if state.get(v, ZeroState.UNKNOWN) != ZeroState.NONZERO:
-                        self.errors.append(
-                            SemanticError(
-                                "Possible division by zero",
-                                expr
-                            )
-                        )
-
-            # recurse
-            self._check_expr(expr.left, state)
-            self._check_expr(expr.right, state)
-
-        elif isinstance(expr, UnaryExpr):
-            self._check_expr(expr.right, state)
-
-        elif isinstance(expr, CallExpr):
-            for arg in expr.arguments:
-                self._check_expr(arg, state)
\ No newline at end of file
+        vidx = self._vidx
+        for node, var in divisions_by_variable(expr):
+            if state[vidx[var]] != _NONZERO:
+                self._errors.append((_DIV_ZERO_MSG, node))
+
+
+# -------------------------
+# Single-return functions
+# -------------------------
+
+def is_single_return(body: Block) -> bool:
+    """
+    True for a body that is exactly one `return expr;`.
+    """
+    stmts = body.statements
+    return len(stmts) == 1 and type(stmts[0]) is ReturnStmt
+
+
+def single_return_diagnostics(stmt: ReturnStmt, params) -> List[SemanticError]:
+    """
+    What the CFG analyses report for a body that is just `stmt`,
+    without building the CFG: it always returns, has nothing
+    unreachable and no stores, every variable read must be a
+    parameter, and nothing is known to be non-zero.
+    """
+    errors: List[SemanticError] = []
+    if stmt.value is None:
+        return errors
+
+    # the entry block's IN: exactly the parameters are assigned; a
+    # repeated parameter name keeps its first bit
+    bit: Dict[str, int] = {}
+    for p in params:
+        bit.setdefault(p.name, 1 << len(bit))
+    reads = ((var, bit.get(var, 0)) for var in classify_stmt(stmt)[0])
+    for var in unassigned_reads(reads, (1 << len(bit)) - 1):
+        errors.append(SemanticError(_UNASSIGNED_MSG.format(var), stmt))
+
+    # no variable is known to be non-zero
+    for node, _ in divisions_by_variable(stmt.value):
+        errors.append(SemanticError(_DIV_ZERO_MSG, node))
+
+    return errors
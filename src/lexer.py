@@ -1,11 +1,45 @@
+import re
+import sys
+from array import array
 from typing import List
-from tokens import Token, TokenType, KEYWORDS
+from tokens import Token, TokenColumns, TokenType, KEYWORDS, OPERATORS
 
 
 class LexerError(Exception):
     pass
 
 
+# -----------------------------
+# Master token pattern
+# -----------------------------
+# Alternatives are tried left to right, so comments come before the
+# '/' operator and two-character operators before their one-character
+# prefixes. Anything else falls through to ERROR.
+
+TOKEN_RE = re.compile(r"""
+      (?P<WS>[ \t\r]+)
+    | (?P<NL>\n)
+    | (?P<COMMENT>//[^\n]*)
+    | (?P<IDENT>[a-zA-Z_][a-zA-Z0-9_]*)
+    | (?P<NUMBER>[0-9]+)
+    | (?P<OP>==|!=|<=|>=|&&|\|\||[-+*/=<>!(){};,])
+    | (?P<ERROR>.)
+""", re.VERBOSE)
+
+# values of the common small literals, looked up instead of calling int()
+_SMALL_INTS = {str(i): i for i in range(256)}
+
+# token kinds as TokenType values, for TokenColumns.kinds
+_KEYWORD_KINDS = {lexeme: t.value for lexeme, t in KEYWORDS.items()}
+_OPERATOR_KINDS = {lexeme: t.value for lexeme, t in OPERATORS.items()}
+_IDENT = TokenType.IDENT.value
+_NUMBER = TokenType.NUMBER.value
+_EOF = TokenType.EOF.value
+
+# TokenType value -> member
+_TYPES = {t.value: t for t in TokenType}
+
+
 class Lexer:
     def __init__(self, source: str):
         self.source = source
@@ -18,211 +52,81 @@ class Lexer:
     # -----------------------------
 
     def tokenize(self) -> List[Token]:
-        tokens = []
-
-        while not self._is_at_end():
-            self._skip_whitespace_and_comments()
-
-            if self._is_at_end():
-                break
-
-            token = self._next_token()
-            tokens.append(token)
-
-        tokens.append(Token(TokenType.EOF, None, self.line, self.column))
-        return tokens
-
-    # -----------------------------
-    # Core scanning logic
-    # -----------------------------
-
-    def _next_token(self) -> Token:
-        ch = self._peek()
-
-        # 1. Identifiers / keywords
-        if self._is_alpha(ch) or ch == "_":
-            return self._scan_identifier_or_keyword()
-
-        # 2. Numbers
-        if self._is_digit(ch):
-            return self._scan_number()
-
-        # 3. Operators & delimiters
-        start_line = self.line
-        start_col = self.column
-        
-        # Handle multi-char operators first (==, !=, <=, >=, &&, ||)
-        
-        nt = ch + self._peek_next()
-
-        if nt == '==':
-            self._advance()
-            self._advance()
-            return Token(TokenType.EQEQ, "==", start_line, start_col)
-        elif nt == '!=':
-            self._advance()
-            self._advance()
-            return Token(TokenType.NEQ, "!=", start_line, start_col)
-        elif nt == '<=':
-            self._advance()
-            self._advance()
-            return Token(TokenType.LE, "<=", start_line, start_col)
-        elif nt == '>=':
-            self._advance()
-            self._advance()
-            return Token(TokenType.GE, ">=", start_line, start_col)
-        elif nt == '&&':
-            self._advance()
-            self._advance()
-            return Token(TokenType.ANDAND, "&&", start_line, start_col)
-        elif nt == '||':
-            self._advance()
-            self._advance()
-            return Token(TokenType.OROR, "||", start_line, start_col)
-
-        # Then single-char tokens (+ - * / = < > ! ( ) { } ; ,)
-
-        if ch == '+':
-            self._advance()
-            return Token(TokenType.PLUS, "+", start_line, start_col)
-        elif ch == '-':
-            self._advance()
-            return Token(TokenType.MINUS, "-", start_line, start_col)
-        elif ch == '*':
-            self._advance()
-            return Token(TokenType.STAR, "*", start_line, start_col)
-        elif ch == '/':
-            self._advance()
-            return Token(TokenType.SLASH, "/", start_line, start_col)
-        elif ch == '=':
-            self._advance()
-            return Token(TokenType.EQ, "=", start_line, start_col)
-        elif ch == '<':
-            self._advance()
-            return Token(TokenType.LT, "<", start_line, start_col)
-        elif ch == '>':
-            self._advance()
-            return Token(TokenType.GT, ">", start_line, start_col)
-        elif ch == '!':
-            self._advance()
-            return Token(TokenType.NOT, "!", start_line, start_col)
-        elif ch == '(':
-            self._advance()
-            return Token(TokenType.LPAREN, "(", start_line, start_col)
-        elif ch == ')':
-            self._advance()
-            return Token(TokenType.RPAREN, ")", start_line, start_col)
-        elif ch == '{':
-            self._advance()
-            return Token(TokenType.LBRACE, "{", start_line, start_col)
-        elif ch == '}':
-            self._advance()
-            return Token(TokenType.RBRACE, "}", start_line, start_col)
-        elif ch == ';':
-            self._advance()
-            return Token(TokenType.SEMI, ";", start_line, start_col)
-        elif ch == ',':
-            self._advance()
-            return Token(TokenType.COMMA, ",", start_line, start_col)
-                
-        # 4. If nothing matched → error
-        raise LexerError(
-            f"Unexpected character '{ch}' at line {self.line}, column {self.column}"
-        )
-
-    # -----------------------------
-    # Token scanners
-    # -----------------------------
-
-    def _scan_identifier_or_keyword(self) -> Token:
-        start_line = self.line
-        start_col = self.column
-
-        # Consume letters, digits, underscores
-        lexeme = self._consume_while(lambda c: self._is_alnum(c) or c == "_")
-
-        # If lexeme in KEYWORDS → keyword token
-        # Else → IDENT token
-        token_type = KEYWORDS.get(lexeme, TokenType.IDENT)
-        return Token(token_type, lexeme, start_line, start_col)
-
-    def _scan_number(self) -> Token:
-        start_line = self.line
-        start_col = self.column
-
-        # Consume the entire number
-        num = self._consume_while(lambda c: self._is_digit(c))
-
-        return Token(TokenType.NUMBER, int(num), start_line, start_col)
-
-    # -----------------------------
-    # Helpers for skipping
-    # -----------------------------
-
-    def _skip_whitespace_and_comments(self):
-        while not self._is_at_end():
-            ch = self._peek()
-
-            # whitespace
-            if ch in " \t\r\n":
-                self._advance()
+        kinds, values, lines, columns = self.tokenize_columns()
+        types = _TYPES
+        return [
+            Token(types[k], v, l, c)
+            for k, v, l, c in zip(kinds, values, lines, columns)
+        ]
+
+    def tokenize_columns(self) -> TokenColumns:
+        """
+        Same tokens as tokenize(), as parallel arrays instead of
+        one Token object each.
+        """
+        kinds = []
+        values = []
+        lines = []
+        columns = []
+        line = 1
+        line_start = 0
+
+        for m in TOKEN_RE.finditer(self.source):
+            kind = m.lastgroup
+
+            # whitespace & comments
+            if kind == "WS" or kind == "COMMENT":
                 continue
 
-            # single-line comments: //
-            if ch == "/" and self._peek_next() == "/":
-                self._consume_while(lambda c: c != "\n")
+            if kind == "NL":
+                line += 1
+                line_start = m.end()
                 continue
 
-            break
-
-    # -----------------------------
-    # Character-level utilities
-    # -----------------------------
-
-    def _peek(self) -> str:
-        if self._is_at_end():
-            return "\0"
-        return self.source[self.pos]
-
-    def _peek_next(self) -> str:
-        if self.pos + 1 >= len(self.source):
-            return "\0"
-        return self.source[self.pos + 1]
-
-    def _advance(self) -> str:
-        ch = self.source[self.pos]
-        self.pos += 1
-
-        if ch == "\n":
-            self.line += 1
-            self.column = 1
-        else:
-            self.column += 1
-
-        return ch
-
-    def _is_at_end(self) -> bool:
-        return self.pos >= len(self.source)
-
-    # -----------------------------
-    # Character classification
-    # -----------------------------
-
-    def _is_alpha(self, c: str) -> bool:
-        return c.isalpha()
-
-    def _is_digit(self, c: str) -> bool:
-        return c.isdigit()
-
-    def _is_alnum(self, c: str) -> bool:
-        return c.isalnum()
-
-    # -----------------------------
-    # Generic consume helper
-    # -----------------------------
-
-    def _consume_while(self, predicate) -> str:
-        result = ""
-        while not self._is_at_end() and predicate(self._peek()):
-            result += self._advance()
-        return result
+            lexeme = m.group()
+            column = m.start() - line_start + 1
+
+            # Identifiers / keywords
+            if kind == "IDENT":
+                token_kind = _KEYWORD_KINDS.get(lexeme, _IDENT)
+                if token_kind == _IDENT:
+                    # one shared str object per distinct name
+                    lexeme = sys.intern(lexeme)
+                kinds.append(token_kind)
+                values.append(lexeme)
+
+            # Numbers
+            elif kind == "NUMBER":
+                value = _SMALL_INTS.get(lexeme)
+                if value is None:
+                    value = int(lexeme)
+                kinds.append(_NUMBER)
+                values.append(value)
+
+            # Operators & delimiters
+            elif kind == "OP":
+                kinds.append(_OPERATOR_KINDS[lexeme])
+                # shared like identifiers, so equal operators are one object
+                values.append(sys.intern(lexeme))
+
+            # If nothing matched → error
+            else:
+                raise LexerError(
+                    f"Unexpected character '{lexeme}' at line {line}, column {column}"
+                )
+
+            lines.append(line)
+            columns.append(column)
+
+        self.pos = len(self.source)
+        self.line = line
+        self.column = self.pos - line_start + 1
+
+        kinds.append(_EOF)
+        values.append(None)
+        lines.append(self.line)
+        columns.append(self.column)
+
+        return TokenColumns(
+            array("B", kinds), values, array("I", lines), array("I", columns)
+        )
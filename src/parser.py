@@ -1,16 +1,114 @@
-from typing import List
-from tokens import Token, TokenType
+from array import array
+from typing import Any, FrozenSet, List, Union
+from tokens import Token, TokenColumns, TokenType
 from ast_nodes import *
 
 
+# token kinds as plain ints: the parser keeps the kind of every token in
+# a byte array and compares/hashes these instead of TokenType members
+_EOF = TokenType.EOF.value
+_IDENT = TokenType.IDENT.value
+_NUMBER = TokenType.NUMBER.value
+_TRUE = TokenType.TRUE.value
+_FALSE = TokenType.FALSE.value
+
+_INT = TokenType.INT.value
+_BOOL = TokenType.BOOL.value
+_IF = TokenType.IF.value
+_ELSE = TokenType.ELSE.value
+_WHILE = TokenType.WHILE.value
+_RETURN = TokenType.RETURN.value
+_PRINT = TokenType.PRINT.value
+
+_PLUS = TokenType.PLUS.value
+_MINUS = TokenType.MINUS.value
+_STAR = TokenType.STAR.value
+_SLASH = TokenType.SLASH.value
+_EQ = TokenType.EQ.value
+_EQEQ = TokenType.EQEQ.value
+_NEQ = TokenType.NEQ.value
+_LT = TokenType.LT.value
+_GT = TokenType.GT.value
+_LE = TokenType.LE.value
+_GE = TokenType.GE.value
+_ANDAND = TokenType.ANDAND.value
+_OROR = TokenType.OROR.value
+_NOT = TokenType.NOT.value
+
+_LPAREN = TokenType.LPAREN.value
+_RPAREN = TokenType.RPAREN.value
+_LBRACE = TokenType.LBRACE.value
+_RBRACE = TokenType.RBRACE.value
+_SEMI = TokenType.SEMI.value
+_COMMA = TokenType.COMMA.value
+
+# token groups tested by _match(); none of them contains EOF
+_TYPE_KEYWORDS = frozenset({_INT, _BOOL})
+
+# binary operator -> precedence (higher binds tighter); other kinds are
+# absent, which ends an expression
+_BINARY_PREC = {
+    _OROR: 1,
+    _ANDAND: 2,
+    _EQEQ: 3, _NEQ: 3,
+    _GT: 4, _LT: 4, _LE: 4, _GE: 4,
+    _PLUS: 5, _MINUS: 5,
+    _STAR: 6, _SLASH: 6,
+}
+
+# keywords that can only start a statement; error recovery resumes at them
+_STMT_KEYWORDS = frozenset({_IF, _WHILE, _RETURN, _PRINT, _INT, _BOOL})
+
+
 class ParseError(Exception):
     pass
 
 
 class Parser:
-    def __init__(self, tokens: List[Token]):
-        self.tokens = tokens
-        self.pos = 0
+    def __init__(self, tokens: Union[List[Token], TokenColumns]):
+        self.pos: int = 0
+
+        # per-token fields as parallel sequences, so the helpers below
+        # index an array instead of loading attributes off a Token
+        # (kinds are the small ints defined at the top of this module);
+        # Lexer.tokenize_columns() produces them directly
+        if not isinstance(tokens, TokenColumns):
+            tokens = TokenColumns(
+                array("B", [t.type.value for t in tokens]),
+                [t.value for t in tokens],
+                array("I", [t.line for t in tokens]),
+                array("I", [t.column for t in tokens]),
+            )
+        self._kinds: array = tokens.kinds      # "B": token kinds
+        self._vals: List[Any] = tokens.values
+        self._lines: array = tokens.lines      # "I"
+        self._cols: array = tokens.columns     # "I"
+
+        # syntax errors recovered from so far, in source order
+        self.errors: List[ParseError] = []
+
+        # first token kind -> statement parser
+        self._stmt_dispatch = {
+            _IF: self._parse_if,
+            _WHILE: self._parse_while,
+            _RETURN: self._parse_return,
+            _LBRACE: self._parse_block,
+            _PRINT: self._parse_print,
+            _IDENT: self._parse_assign,
+            _INT: self._parse_var_decl,
+            _BOOL: self._parse_var_decl,
+        }
+
+        # consumed token kind -> factor parser, called with its position
+        self._factor_dispatch = {
+            _NUMBER: self._parse_number,
+            _TRUE: self._parse_bool,
+            _FALSE: self._parse_bool,
+            _IDENT: self._parse_name,
+            _LPAREN: self._parse_group,
+            _NOT: self._parse_not,
+            _MINUS: self._parse_negate,
+        }
 
     # -----------------------------
     # Entry point
@@ -21,11 +119,19 @@ class Parser:
         program ::= function*
         """
         functions = []
-        pos = SourcePos(self._peek().line, self._peek().column)
+        pos = SourcePos(self._lines[self.pos], self._cols[self.pos])
 
         while not self._is_at_end():
-            functions.append(self._parse_function())
-        
+            try:
+                functions.append(self._parse_function())
+            except ParseError as e:
+                self.errors.append(e)
+                self._sync_function()
+
+        # every error has been collected; surface the first one
+        if self.errors:
+            raise self.errors[0]
+
         return Program(pos, functions)
 
 
@@ -33,47 +139,119 @@ class Parser:
     # Helpers for token handling
     # -----------------------------
 
+    def _token_at(self, i: int) -> Token:
+        # only needed for error messages
+        return Token(TokenType(self._kinds[i]), self._vals[i], self._lines[i], self._cols[i])
+
     def _peek(self) -> Token:
-        return self.tokens[self.pos]
+        return self._token_at(self.pos)
 
     def _previous(self) -> Token:
-        return self.tokens[self.pos - 1]
+        return self._token_at(self.pos - 1)
+
+    def _previous_value(self):
+        return self._vals[self.pos - 1]
+
+    def _previous_pos(self) -> SourcePos:
+        i = self.pos - 1
+        return SourcePos(self._lines[i], self._cols[i])
 
     def _is_at_end(self) -> bool:
-        return self._peek().type == TokenType.EOF
+        return self._kinds[self.pos] == _EOF
 
-    def _advance(self) -> Token:
-        if not self._is_at_end():
+    def _advance(self):
+        """
+        Consume the current token (EOF is never consumed) and
+        return the value of the last consumed token.
+        """
+        if self._kinds[self.pos] != _EOF:
             self.pos += 1
-        return self._previous()
+        return self._vals[self.pos - 1]
 
-    def _check(self, ttype: TokenType) -> bool:
-        if self._is_at_end():
-            return False
-        return self._peek().type == ttype
+    def _check(self, ttype: int) -> bool:
+        kind = self._kinds[self.pos]
+        return kind == ttype and kind != _EOF
 
-    def _match(self, *types: TokenType) -> bool:
+    def _match(self, types: FrozenSet[int]) -> bool:
         """
-        If current token matches any in types, consume it and return True.
+        If current token is in types, consume it and return True.
         """
-        if self._peek().type in types:
-            self._advance()
+        if self._kinds[self.pos] in types:
+            self.pos += 1
+            return True
+        return False
+
+    def _match_one(self, ttype: int) -> bool:
+        """
+        If current token is of type ttype, consume it and return True.
+        """
+        if self._kinds[self.pos] == ttype:
+            self.pos += 1
             return True
         return False
-        
 
-    def _expect(self, ttype: TokenType, msg: str):
+    def _expect(self, ttype: int, msg: str):
         """
-        Consume token of type ttype, else error.
+        Consume token of type ttype and return its value, else error.
         """
-        if self._peek().type == ttype:
-            self._advance()
+        i = self.pos
+        if self._kinds[i] == ttype:
+            if ttype != _EOF:
+                self.pos = i + 1
+            return self._vals[i]
         else:
             tok = self._peek()
             raise ParseError(
-                f"{msg} (expected {ttype}, got {tok.type} at {tok.line}:{tok.column})"
+                f"{msg} (expected {TokenType(ttype)}, got {tok.type} at {tok.line}:{tok.column})"
             )
 
+    # -----------------------------
+    # Error recovery
+    # -----------------------------
+
+    def _sync_statement(self) -> None:
+        """
+        Skip the rest of a broken statement, stopping after its ';',
+        before a keyword that starts the next statement, or before
+        the '}' closing the enclosing block. Nested braces are
+        skipped whole.
+        """
+        kinds = self._kinds
+        depth = 0
+        while True:
+            kind = kinds[self.pos]
+            if kind == _EOF:
+                return
+            if depth == 0:
+                if kind == _SEMI:
+                    self.pos += 1
+                    return
+                if kind == _RBRACE or kind in _STMT_KEYWORDS:
+                    return
+            if kind == _LBRACE:
+                depth += 1
+            elif kind == _RBRACE:
+                depth -= 1
+            self.pos += 1
+
+    def _sync_function(self) -> None:
+        """
+        Skip to the start of the next function definition
+        (type IDENT "("), or to EOF.
+        """
+        kinds = self._kinds
+        if kinds[self.pos] != _EOF:
+            self.pos += 1
+
+        while kinds[self.pos] != _EOF:
+            if (
+                kinds[self.pos] in _TYPE_KEYWORDS
+                and kinds[self.pos + 1] == _IDENT
+                and kinds[self.pos + 2] == _LPAREN
+            ):
+                return
+            self.pos += 1
+
     # -----------------------------
     # Top-level constructs
     # -----------------------------
@@ -83,22 +261,21 @@ class Parser:
         function ::= type IDENT "(" params ")" block
         """
         
-        if not self._match(TokenType.INT, TokenType.BOOL):
+        if not self._match(_TYPE_KEYWORDS):
             tok = self._peek()
             raise ParseError(
                 f"Expected function return type at {tok.line}:{tok.column}"
             )
-        rtype = self._previous().value
-        pos = SourcePos(self._previous().line, self._previous().column)
+        rtype = self._previous_value()
+        pos = self._previous_pos()
 
-        self._expect(TokenType.IDENT, "Missing function name")
-        fname = self._previous().value
+        fname = self._expect(_IDENT, "Missing function name")
 
-        self._expect(TokenType.LPAREN, f"Missing '(' after function name {fname}")
+        self._expect(_LPAREN, f"Missing '(' after function name {fname}")
 
         params = self._parse_params()
 
-        self._expect(TokenType.RPAREN, f"Missing ')' for function {fname}")
+        self._expect(_RPAREN, f"Missing ')' for function {fname}")
 
         body = self._parse_block()
 
@@ -111,25 +288,26 @@ class Parser:
         params = []
 
         # empty parameter list
-        if self._check(TokenType.RPAREN):
+        if self._check(_RPAREN):
             return params
 
-        while not self._check(TokenType.RPAREN) and not self._is_at_end():
-            if not (self._check(TokenType.INT) or self._check(TokenType.BOOL)):
+        append = params.append
+
+        while not self._check(_RPAREN) and not self._is_at_end():
+            if self._kinds[self.pos] not in _TYPE_KEYWORDS:
                 tok = self._peek()
                 raise ParseError(
                     f"Expected parameter type at {tok.line}:{tok.column}"
                 )
 
-            ptype = self._advance().value
-            pos = SourcePos(self._previous().line, self._previous().column)
+            ptype = self._advance()
+            pos = self._previous_pos()
 
-            self._expect(TokenType.IDENT, "Missing parameter name")
-            pname = self._previous().value
+            pname = self._expect(_IDENT, "Missing parameter name")
 
-            params.append(Param(pos, ptype, pname))
+            append(Param(pos, ptype, pname))
 
-            if not self._match(TokenType.COMMA):
+            if not self._match_one(_COMMA):
                 break
 
         return params
@@ -138,14 +316,19 @@ class Parser:
         """
         block ::= "{" statement* "}"
         """
-        self._expect(TokenType.LBRACE, "Missing '{'")
-        pos = SourcePos(self._previous().line, self._previous().column)
+        self._expect(_LBRACE, "Missing '{'")
+        pos = self._previous_pos()
         
         statements = []
-        while not self._check(TokenType.RBRACE) and not self._is_at_end():
-            statements.append(self._parse_statement())
+        append = statements.append
+        while not self._check(_RBRACE) and not self._is_at_end():
+            try:
+                append(self._parse_statement())
+            except ParseError as e:
+                self.errors.append(e)
+                self._sync_statement()
 
-        self._expect(TokenType.RBRACE, "Missing '}'")
+        self._expect(_RBRACE, "Missing '}'")
 
         return Block(pos, statements)
 
@@ -164,64 +347,51 @@ class Parser:
                     | print_stmt
                     | block
         """
-        if self._check(TokenType.IF):
-            return self._parse_if()
-        elif self._check(TokenType.WHILE):
-            return self._parse_while()
-        elif self._check(TokenType.RETURN):
-            return self._parse_return()
-        elif self._check(TokenType.LBRACE):
-            return self._parse_block()
-        elif self._check(TokenType.PRINT):
-            return self._parse_print()
-        elif self._check(TokenType.IDENT):
-            return self._parse_assign()
-        elif self._check(TokenType.INT) or self._check(TokenType.BOOL):
-            return self._parse_var_decl()
-        else:
+        handler = self._stmt_dispatch.get(self._kinds[self.pos])
+        if handler is None:
             tok = self._peek()
             raise ParseError(
                 f"Unexpected token {tok.type} at {tok.line}:{tok.column}"
             )
+        return handler()
 
     def _parse_var_decl(self) -> VarDecl:
-        var_type = self._advance().value
-        pos = SourcePos(self._previous().line, self._previous().column)
+        var_type = self._advance()
+        pos = self._previous_pos()
         
-        self._expect(TokenType.IDENT, "Variable name missing")
-        var_name = self._previous().value
+        var_name = self._expect(_IDENT, "Variable name missing")
 
-        if self._match(TokenType.EQ):
+        if self._match_one(_EQ):
             expr = self._parse_expr()
         else:
             expr = None
         
-        self._expect(TokenType.SEMI, "Missing ';' after variable declaration")
+        self._expect(_SEMI, "Missing ';' after variable declaration")
         return VarDecl(pos, var_type, var_name, expr)
 
     def _parse_assign(self) -> Assign:
-        var_name = self._advance().value
-        pos = SourcePos(self._previous().line, self._previous().column)
+        var_name = self._advance()
+        pos = self._previous_pos()
 
-        self._expect(TokenType.EQ, "Missing '=' in variable assignment")
+        self._expect(_EQ, "Missing '=' in variable assignment")
         val = self._parse_expr()
 
-        self._expect(TokenType.SEMI, "Missing ';' after variable assignment")
+        self._expect(_SEMI, "Missing ';' after variable assignment")
         return Assign(pos, var_name, val)
 
     def _parse_if(self) -> IfStmt:
-        self._expect(TokenType.IF, "Expected 'if'")
-        pos = SourcePos(self._previous().line, self._previous().column)
+        self._expect(_IF, "Expected 'if'")
+        pos = self._previous_pos()
 
-        self._expect(TokenType.LPAREN, "Missing '(' in if statement")
+        self._expect(_LPAREN, "Missing '(' in if statement")
 
         expr = self._parse_expr()
 
-        self._expect(TokenType.RPAREN, "Missing ')' in if statement")
+        self._expect(_RPAREN, "Missing ')' in if statement")
 
         body = self._parse_block()
 
-        if self._match(TokenType.ELSE):
+        if self._match_one(_ELSE):
             else_body = self._parse_block()
         else:
             else_body = None
@@ -229,14 +399,14 @@ class Parser:
         return IfStmt(pos, expr, body, else_body)
 
     def _parse_while(self) -> WhileStmt:
-        self._expect(TokenType.WHILE, "Expected 'while'")
-        pos = SourcePos(self._previous().line, self._previous().column)
+        self._expect(_WHILE, "Expected 'while'")
+        pos = self._previous_pos()
         
-        self._expect(TokenType.LPAREN, "Missing '(' in while statement")
+        self._expect(_LPAREN, "Missing '(' in while statement")
 
         expr = self._parse_expr()
 
-        self._expect(TokenType.RPAREN, "Missing ')' in while statement")
+        self._expect(_RPAREN, "Missing ')' in while statement")
 
         body = self._parse_block()
 
@@ -244,25 +414,25 @@ class Parser:
 
 
     def _parse_return(self) -> ReturnStmt:
-        self._expect(TokenType.RETURN, "Expected 'return'")
-        pos = SourcePos(self._previous().line, self._previous().column)
+        self._expect(_RETURN, "Expected 'return'")
+        pos = self._previous_pos()
 
         val = self._parse_expr()
 
-        self._expect(TokenType.SEMI, "Missing ';' after return statement")
+        self._expect(_SEMI, "Missing ';' after return statement")
         return ReturnStmt(pos, val)
 
     def _parse_print(self) -> PrintStmt:
-        self._expect(TokenType.PRINT, "Expected 'print'")
-        pos = SourcePos(self._previous().line, self._previous().column)
+        self._expect(_PRINT, "Expected 'print'")
+        pos = self._previous_pos()
 
-        self._expect(TokenType.LPAREN, "Missing '(' in print statement")
+        self._expect(_LPAREN, "Missing '(' in print statement")
         
         val = self._parse_expr()
         
-        self._expect(TokenType.RPAREN, "Missing ')' in print statement")
+        self._expect(_RPAREN, "Missing ')' in print statement")
         
-        self._expect(TokenType.SEMI, "Missing ';' after print statement")
+        self._expect(_SEMI, "Missing ';' after print statement")
         
         return PrintStmt(pos, val)
 
@@ -274,67 +444,32 @@ class Parser:
         """
         expr ::= logical_or
         """
-        return self._parse_logical_or()
-
-    def _parse_logical_or(self) -> Expr:
-        left = self._parse_logical_and()
-        
-        while self._match(TokenType.OROR):
-            op = self._previous().value
-            right = self._parse_logical_and()
-            left = BinaryExpr(left.pos, left, op, right)
-        
-        return left
+        return self._parse_binary(1)
 
-    def _parse_logical_and(self) -> Expr:
-        left = self._parse_equality()
-        
-        while self._match(TokenType.ANDAND):
-            op = self._previous().value
-            right = self._parse_equality()
-            left = BinaryExpr(left.pos, left, op, right)
-        
-        return left
-
-    def _parse_equality(self) -> Expr:
-        left = self._parse_relational()
-        
-        while self._match(TokenType.EQEQ, TokenType.NEQ):
-            op = self._previous().value
-            right = self._parse_relational()
-            left = BinaryExpr(left.pos, left, op, right)
-        
-        return left
-
-    def _parse_relational(self) -> Expr:
-        left = self._parse_additive()
-        
-        while self._match(TokenType.GT, TokenType.LT, TokenType.LE, TokenType.GE):
-            op = self._previous().value
-            right = self._parse_additive()
-            left = BinaryExpr(left.pos, left, op, right)
-        
-        return left
+    def _parse_binary(self, min_prec: int) -> Expr:
+        """
+        logical_or ::= logical_and ("||" logical_and)*
+        logical_and ::= equality ("&&" equality)*
+        equality   ::= relational (("==" | "!=") relational)*
+        relational ::= additive (("<" | ">" | "<=" | ">=") additive)*
+        additive   ::= term (("+" | "-") term)*
+        term       ::= factor (("*" | "/") factor)*
+
+        Precedence climbing over _BINARY_PREC: parses operators binding
+        at least as tightly as min_prec, all left-associative.
+        """
+        left = self._parse_factor()
+        kinds = self._kinds
 
-    def _parse_additive(self) -> Expr:
-        left = self._parse_term()
-        
-        while self._match(TokenType.PLUS, TokenType.MINUS):
-            op = self._previous().value
-            right = self._parse_term()
-            left = BinaryExpr(left.pos, left, op, right)
-        
-        return left
+        while True:
+            prec = _BINARY_PREC.get(kinds[self.pos], 0)
+            if prec < min_prec:
+                return left
 
-    def _parse_term(self) -> Expr:
-        left = self._parse_factor()
-        
-        while self._match(TokenType.STAR, TokenType.SLASH):
-            op = self._previous().value
-            right = self._parse_factor()
+            self.pos += 1
+            op = self._previous_value()
+            right = self._parse_binary(prec + 1)
             left = BinaryExpr(left.pos, left, op, right)
-        
-        return left
 
     def _parse_factor(self) -> Expr:
         """
@@ -346,52 +481,48 @@ class Parser:
                  | "-" factor
         """
 
-        curr = self._advance()
-        pos = SourcePos(self._previous().line, self._previous().column)
+        self._advance()
+        handler = self._factor_dispatch.get(self._kinds[self.pos - 1])
+        if handler is None:
+            curr = self._previous()
+            raise ParseError(f"Unknown token {curr.value} of type {curr.type} in expression at position {curr.line} {curr.column}")
+        return handler(self._previous_pos())
 
-        if curr.type == TokenType.NUMBER:
-            return Literal(pos, curr.value)
-        
-        elif curr.type in [TokenType.TRUE, TokenType.FALSE]:
-            if curr.value == "true":
-                return Literal(pos, True)
-            else:
-                return Literal(pos, False)
-            
-        elif curr.type == TokenType.IDENT:
-            if self._match(TokenType.LPAREN):
-                args = self._parse_args()
-                self._expect(TokenType.RPAREN, "Missing ')' after function arguments")
-                return CallExpr(pos, curr.value, args)
-            else:
-                return VarExpr(pos, curr.value)
-        
-        elif curr.type == TokenType.LPAREN:
-            expr = self._parse_expr()
-            self._expect(TokenType.RPAREN, "Matching ')' not found")
+    def _parse_number(self, pos: SourcePos) -> Expr:
+        return Literal(pos, self._previous_value())
 
-            return expr
-        
-        elif curr.type == TokenType.NOT:
-            expr = self._parse_factor()
-            return UnaryExpr(pos, "!", expr)
-        
-        elif curr.type == TokenType.MINUS:
-            expr = self._parse_factor()
-            return UnaryExpr(pos, "-", expr)
-        
-        else:
-            raise ParseError(f"Unknown token {curr.value} of type {curr.type} in expression at position {curr.line} {curr.column}")
+    def _parse_bool(self, pos: SourcePos) -> Expr:
+        return Literal(pos, self._kinds[self.pos - 1] == _TRUE)
+
+    def _parse_name(self, pos: SourcePos) -> Expr:
+        name = self._previous_value()
+        if self._match_one(_LPAREN):
+            args = self._parse_args()
+            self._expect(_RPAREN, "Missing ')' after function arguments")
+            return CallExpr(pos, name, args)
+        return VarExpr(pos, name)
+
+    def _parse_group(self, pos: SourcePos) -> Expr:
+        expr = self._parse_expr()
+        self._expect(_RPAREN, "Matching ')' not found")
+        return expr
+
+    def _parse_not(self, pos: SourcePos) -> Expr:
+        return UnaryExpr(pos, "!", self._parse_factor())
+
+    def _parse_negate(self, pos: SourcePos) -> Expr:
+        return UnaryExpr(pos, "-", self._parse_factor())
 
     def _parse_args(self) -> List[Expr]:
         args = []
         
-        if self._check(TokenType.RPAREN):
+        if self._check(_RPAREN):
             return args
-        
+
+        append = args.append
         while True:
-            args.append(self._parse_expr())
-            if not self._match(TokenType.COMMA):
+            append(self._parse_expr())
+            if not self._match_one(_COMMA):
                 break
 
         return args
\ No newline at end of file
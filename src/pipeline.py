@@ -1,5 +1,11 @@
-from typing import List
+from typing import Iterator, List, Optional, Tuple
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import hashlib
 import os
+import pickle
+import tempfile
 from lexer import Lexer, LexerError
 from parser import Parser, ParseError
 from semantic import SemanticAnalyzer, SemanticError, Diagnostic
@@ -13,6 +19,10 @@ class AnalysisResult:
     def __init__(self):
         self.errors: List[Diagnostic] = []
 
+        # analyzer failures (not user diagnostics), e.g. a crash in a
+        # CFG analysis; main() prints them under the file's header
+        self.internal_errors: List[str] = []
+
 
     def has_errors(self) -> bool:
         return len(self.errors) > 0
@@ -26,11 +36,108 @@ class AnalysisResult:
 # Main pipeline
 # -------------------------
 
-def analyze_file(path: str) -> AnalysisResult:
-    with open(path) as f:
-        source = f.read()
+def analyze_file(path: str, use_cache: bool = False) -> AnalysisResult:
+    with open(path, "rb") as f:
+        data = f.read()
+
+    if not use_cache:
+        return analyze_source(_decode_source(data))
+
+    # the cache is keyed on the raw bytes, so a hit never decodes
+    key = _cache_key(data)
+    cached = _cache_load(key)
+    if cached is not None:
+        return cached
+
+    result = analyze_source(_decode_source(data))
+    _cache_store(key, result)
+    return result
+
+def _decode_source(data: bytes) -> str:
+    source = data.decode("utf-8")
+
+    # same line endings text-mode open() would have produced
+    if "\r" in source:
+        source = source.replace("\r\n", "\n").replace("\r", "\n")
+    return source
+
+# what crosses a process boundary or goes into the cache: the formatted
+# diagnostics and the internal errors, as plain strings. A diagnostic's
+# node can hold an AST too deep to pickle, and a pickled AnalysisResult
+# names the module it was defined in, which is __main__ under the CLI.
+Payload = Tuple[Tuple[str, ...], Tuple[str, ...]]
+
+def _to_payload(result: AnalysisResult) -> Payload:
+    return tuple(str(e) for e in result.errors), tuple(result.internal_errors)
+
+def _from_payload(payload: Payload) -> AnalysisResult:
+    messages, internal_errors = payload
+    result = AnalysisResult()
+    result.errors = [Diagnostic(m) for m in messages]
+    result.internal_errors = list(internal_errors)
+    return result
+
+# -------------------------
+# Result cache
+# -------------------------
+
+# payloads are pickled under <dir>/<key>.pkl; the key covers the source
+# text and the analyzer's own modules, so editing either invalidates it
+CACHE_DIR = os.environ.get(
+    "MINIC_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "minic"),
+)
+
+_analyzer_fingerprint: Optional[bytes] = None
+
+def _cache_key(data: bytes) -> str:
+    global _analyzer_fingerprint
+    if _analyzer_fingerprint is None:
+        h = hashlib.blake2b(digest_size=16)
+        src_dir = os.path.dirname(os.path.abspath(__file__))
+        for name in sorted(os.listdir(src_dir)):
+            if name.endswith(".py"):
+                with open(os.path.join(src_dir, name), "rb") as f:
+                    h.update(f.read())
+        _analyzer_fingerprint = h.digest()
+
+    h = hashlib.blake2b(_analyzer_fingerprint, digest_size=16)
+    h.update(data)
+    return h.hexdigest()
+
+def _cache_load(key: str) -> Optional[AnalysisResult]:
+    # anything wrong with an entry (missing, truncated, written by
+    # something else) is a miss; unpickling can raise nearly anything
+    try:
+        with open(os.path.join(CACHE_DIR, key + ".pkl"), "rb") as f:
+            messages, internal_errors = pickle.load(f)
+    except Exception:
+        return None
+
+    if not (isinstance(messages, tuple) and isinstance(internal_errors, tuple)):
+        return None
+    if not all(isinstance(m, str) for m in messages + internal_errors):
+        return None
+    return _from_payload((messages, internal_errors))
+
+def _cache_store(key: str, result: AnalysisResult) -> None:
+    # write to a temp file and rename, so concurrent workers never
+    # see a partial entry
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    except OSError:
+        return
 
-    return analyze_source(source)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(_to_payload(result), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, os.path.join(CACHE_DIR, key + ".pkl"))
+    except (OSError, pickle.PickleError):
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
 
 def collect_mc_files(path: str) -> list[str]:
     mc_files = []
@@ -40,10 +147,23 @@ def collect_mc_files(path: str) -> list[str]:
             mc_files.append(path)
         return mc_files
 
-    for root, _, files in os.walk(path):
-        for name in files:
-            if name.endswith(".mc"):
-                mc_files.append(os.path.join(root, name))
+    # scandir hands back the entry type from the directory listing, so
+    # no per-entry stat; hidden entries (.git, ...) are skipped, and so
+    # are directories that cannot be read, as os.walk does
+    pending = [path]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith("."):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif name.endswith(".mc"):
+                        mc_files.append(entry.path)
+        except OSError:
+            continue
 
     return sorted(mc_files)
 
@@ -54,7 +174,7 @@ def analyze_source(source: str) -> AnalysisResult:
     # 1. Lexing
     # -------------------------
     try:
-        tokens = Lexer(source).tokenize()
+        tokens = Lexer(source).tokenize_columns()
     except LexerError as e:
         result.errors.append(Diagnostic(str(e)))
         return result
@@ -62,25 +182,26 @@ def analyze_source(source: str) -> AnalysisResult:
     # -------------------------
     # 2. Parsing
     # -------------------------
+    # the parser recovers at statement / function boundaries and
+    # raises once at the end if it recorded any syntax errors
+    parser = Parser(tokens)
     try:
-        parser = Parser(tokens)
         program: Program = parser.parse()
-    except ParseError as e:
-        result.errors.append(Diagnostic(str(e)))
+    except ParseError:
+        for e in parser.errors:
+            result.errors.append(Diagnostic(str(e)))
         return result
 
     # -------------------------
     # 3. Semantic analysis
     # -------------------------
-    sem = SemanticAnalyzer()
-    sem_errors = sem.analyze(program)
+    sem_errors = SemanticAnalyzer().analyze(program)
     result.errors.extend(sem_errors)
 
     # -------------------------
     # 3.5 Program-level semantics
     # -------------------------
-    prog_checker = ProgramSemanticChecker()
-    prog_errors = prog_checker.check(program)
+    prog_errors = ProgramSemanticChecker().check(program)
     result.errors.extend(prog_errors)
 
     # If main() is invalid or missing, stop here
@@ -92,11 +213,20 @@ def analyze_source(source: str) -> AnalysisResult:
     # -------------------------
     # We run these even if semantic errors exist,
     # so we can report more diagnostics in one go.
+    # one builder per call, so concurrent callers never share state
+    cfg_builder = CFGBuilder()
+
     for fn in program.functions:
         try:
-            cfg = CFGBuilder().build(fn.body)
-            ret_analyzer = CFGReturnAnalyzer(cfg)
-            if not ret_analyzer.function_always_returns():
+            # `return expr;` alone needs no CFG
+            if is_single_return(fn.body):
+                result.errors.extend(
+                    single_return_diagnostics(fn.body.statements[0], fn.params)
+                )
+                continue
+
+            cfg, always_returns = cfg_builder.build_and_check(fn.body)
+            if not always_returns:
                 result.errors.append(
                     SemanticError(
                         f"Function '{fn.name}' may not return a value on all paths",
@@ -133,11 +263,51 @@ def analyze_source(source: str) -> AnalysisResult:
             
         except Exception as e:
             # internal compiler error in CFG phase
-            print(f"CFG error in function '{fn.name}':", e)
+            result.internal_errors.append(f"CFG error in function '{fn.name}': {e}")
 
     return result
 
 
+def _analyze_file_guarded(
+    path: str, use_cache: bool = False
+) -> Tuple[Optional[Payload], Optional[Exception]]:
+    try:
+        return _to_payload(analyze_file(path, use_cache)), None
+    except Exception as e:
+        return None, e
+
+def analyze_files(
+    paths: List[str], use_cache: bool = False
+) -> Iterator[Tuple[Optional[AnalysisResult], Optional[Exception]]]:
+    """
+    Analyze independent files across worker processes.
+    Yields (result, internal error) pairs in the order of paths, each
+    as soon as that file is done. The results' errors are plain
+    Diagnostics carrying the formatted message.
+    """
+    analyze = partial(_analyze_file_guarded, use_cache=use_cache)
+
+    if len(paths) < 2:
+        for p in paths:
+            payload, error = analyze(p)
+            yield (None if payload is None else _from_payload(payload)), error
+        return
+
+    workers = min(os.cpu_count() or 1, len(paths))
+
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        pending = deque(ex.submit(analyze, p) for p in paths)
+        while pending:
+            try:
+                payload, error = pending.popleft().result()
+            except Exception as e:
+                # the worker died or its result could not be sent back;
+                # only this file is affected
+                yield None, e
+                continue
+            yield (None if payload is None else _from_payload(payload)), error
+
+
 # -------------------------
 # CLI entry point
 # -------------------------
@@ -146,11 +316,18 @@ def main():
     import sys
     import os
 
-    if len(sys.argv) != 2:
-        print("Usage: python pipeline.py <file.mc | directory>")
+    args = sys.argv[1:]
+
+    # --cache: reuse results stored under CACHE_DIR (off by default)
+    use_cache = "--cache" in args
+    if use_cache:
+        args.remove("--cache")
+
+    if len(args) != 1:
+        print("Usage: python pipeline.py [--cache] <file.mc | directory>")
         return
 
-    path = sys.argv[1]
+    path = args[0]
 
     mc_files = collect_mc_files(path)
 
@@ -161,17 +338,18 @@ def main():
     total = 0
     failed = 0
 
-    for file_path in mc_files:
+    for file_path, (result, error) in zip(mc_files, analyze_files(mc_files, use_cache)):
         total += 1
         print(f"\n=== Analyzing {file_path} ===")
 
-        try:
-            result = analyze_file(file_path)
-        except Exception as e:
-            print("❌ Internal error:", e)
+        if error is not None:
+            print("❌ Internal error:", error)
             failed += 1
             continue
 
+        for message in result.internal_errors:
+            print(message)
+
         if result.has_errors():
             failed += 1
             print("❌ Errors found:")
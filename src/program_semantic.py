@@ -6,18 +6,13 @@ class ProgramSemanticChecker:
     def check(self, program: Program):
         errors = []
 
-        mains = [fn for fn in program.functions if fn.name == "main"]
+        found_main = False
 
-        if len(mains) == 0:
-            errors.append(
-                SemanticError(
-                    "Missing entry function 'main'",
-                    program
-                )
-            )
-            return errors   # fatal → stop early
+        for main_fn in program.functions:
+            if main_fn.name != "main":
+                continue
+            found_main = True
 
-        for main_fn in mains:
             # Signature check (adjust if your AST differs)
             if main_fn.return_type != "int":
                 errors.append(
@@ -35,4 +30,12 @@ class ProgramSemanticChecker:
                     )
                 )
 
+        if not found_main:
+            errors.append(
+                SemanticError(
+                    "Missing entry function 'main'",
+                    program
+                )
+            )
+
         return errors
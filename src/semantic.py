@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List, Tuple
 
 from symbols import Symbol, SymbolKind, ScopeStack, Type
 from ast_nodes import *
@@ -13,6 +13,8 @@ class Diagnostic:
     Not an exception.
     """
 
+    __slots__ = ("message",)
+
     def __init__(self, message: str):
         self.message = message
 
@@ -20,14 +22,21 @@ class Diagnostic:
         return self.message
 
 class SemanticError(Diagnostic):
+    __slots__ = ("node", "_formatted")
+
     def __init__(self, message: str, node=None):
         super().__init__(message)
         self.node = node
+        self._formatted = None
 
     def __str__(self):
-        if self.node is not None and hasattr(self.node, "pos"):
-            return f"{self.message} at {self.node.pos}"
-        return self.message
+        # formatted on first use, then reused
+        if self._formatted is None:
+            if self.node is not None and hasattr(self.node, "pos"):
+                self._formatted = f"{self.message} at {self.node.pos}"
+            else:
+                self._formatted = self.message
+        return self._formatted
 
 
 
@@ -35,17 +44,66 @@ class SemanticError(Diagnostic):
 # Analyzer
 # -------------------------
 
+# Type members as plain globals: attribute access on an Enum class goes
+# through its metaclass, which is slow enough to matter in hot visitors
+_INT = Type.INT
+_BOOL = Type.BOOL
+
+# source type name -> Type
+_TYPE_MAP = {"int": Type.INT, "bool": Type.BOOL}
+
+# Python type of a Literal's value -> Type
+_LITERAL_TYPES = {int: Type.INT, bool: Type.BOOL}
+
+# binary operator categories checked by _visit_binary
+_ARITH_OPS = frozenset({"+", "-", "*", "/"})
+_RELATIONAL_OPS = frozenset({"<", ">", "<=", ">="})
+_EQUALITY_OPS = frozenset({"==", "!="})
+_LOGICAL_OPS = frozenset({"&&", "||"})
+
 class SemanticAnalyzer:
     def __init__(self):
+        # node type -> visitor, keyed on exact type
+        self._stmt_dispatch = {
+            VarDecl: self._visit_var_decl,
+            Assign: self._visit_assign,
+            IfStmt: self._visit_if,
+            WhileStmt: self._visit_while,
+            ReturnStmt: self._visit_return,
+            PrintStmt: self._visit_print,
+            Block: self._visit_block,
+        }
+        self._expr_dispatch = {
+            VarExpr: self._visit_var_expr,
+            CallExpr: self._visit_call_expr,
+            BinaryExpr: self._visit_binary,
+            UnaryExpr: self._visit_unary,
+        }
+
+        self.reset()
+
+    def reset(self):
+        """
+        Drop all per-program state, so one analyzer can check
+        several programs in turn.
+        """
         self.scopes = ScopeStack()
-        self.errors: List[SemanticError] = []
+        self._errors: List[Tuple[str, ASTNode]] = []
         self.current_function_return_type = None
 
+        # id(FunctionDef) -> (return type, parameter types)
+        self._signatures: Dict[int, Tuple[Type, Tuple[Type, ...]]] = {}
+
     # -------------------------
     # Entry point
     # -------------------------
 
+    @property
+    def errors(self) -> List[SemanticError]:
+        return [SemanticError(msg, node) for msg, node in self._errors]
+
     def analyze(self, program: Program):
+        self.reset()
 
         self.scopes.push_scope()     # global scope
         self._visit_program(program)
@@ -80,7 +138,7 @@ class SemanticAnalyzer:
         sym = Symbol(
             name = node.name,
             kind = SymbolKind.FUNC,
-            type = self._map_type(node.return_type),
+            type = self._signature(node)[0],
             decl_node = node
         )
         self.scopes.define(sym)
@@ -90,24 +148,26 @@ class SemanticAnalyzer:
 
         old_ret_type = self.current_function_return_type
 
-        self.current_function_return_type = self._map_type(node.return_type)
+        ret_type, param_types = self._signature(node)
+        self.current_function_return_type = ret_type
 
 
         # define parameters
-        for param in node.params:
+        for param, ptype in zip(node.params, param_types):
             if self.scopes.lookup_current(param.name):
                 self._error(f"Redeclaration of parameter '{param.name}'", param)
             else:
                 psym = Symbol(
                     name = param.name,
                     kind = SymbolKind.PARAM,
-                    type = self._map_type(param.type),
+                    type = ptype,
                     decl_node = param
                 )
                 self.scopes.define(psym)
 
-        # visit body
-        self._visit_block(node.body)
+        # the body's outermost block shares the parameter scope, so
+        # a local cannot redeclare a parameter (as in C)
+        self._visit_statements(node.body)
 
         self.current_function_return_type = old_ret_type
         self.scopes.pop_scope()
@@ -118,41 +178,32 @@ class SemanticAnalyzer:
 
     def _visit_block(self, node: Block):
         self.scopes.push_scope()
-        reachable = True
+        self._visit_statements(node)
+        self.scopes.pop_scope()
 
-        for stmt in node.statements:
-            if not reachable:
-                self._error("Unreachable code", stmt)
-                continue
+    def _visit_statements(self, node: Block):
+        """
+        Visit a block's statements in the current scope.
+        """
+        statements = node.statements
 
+        for i, stmt in enumerate(statements, 1):
             self._visit_stmt(stmt)
 
             if isinstance(stmt, ReturnStmt):
-                reachable = False
-        
-        self.scopes.pop_scope()
+                # Report the dead tail once, at its first statement.
+                if i < len(statements):
+                    self._error("Unreachable code", statements[i])
+                break
 
     def _visit_stmt(self, node: Stmt):
         """
         Dispatch based on statement kind.
         """
-        # Replace these isinstance checks with your real AST classes
-        if isinstance(node, VarDecl):
-            self._visit_var_decl(node)
-        elif isinstance(node, Assign):
-            self._visit_assign(node)
-        elif isinstance(node, IfStmt):
-            self._visit_if(node)
-        elif isinstance(node, WhileStmt):
-            self._visit_while(node)
-        elif isinstance(node, ReturnStmt):
-            self._visit_return(node)
-        elif isinstance(node, PrintStmt):
-            self._visit_print(node)
-        elif isinstance(node, Block):
-            self._visit_block(node)
-        else:
+        handler = self._stmt_dispatch.get(type(node))
+        if handler is None:
             raise RuntimeError(f"Unhandled statement type: {type(node)}")
+        handler(node)
 
     def _visit_var_decl(self, node: VarDecl):
 
@@ -260,25 +311,22 @@ class SemanticAnalyzer:
     # -------------------------
 
     def _visit_expr(self, node: Expr):
-        if isinstance(node, VarExpr):
-            self._visit_var_expr(node)
-        elif isinstance(node, CallExpr):
-            self._visit_call_expr(node)
-        elif isinstance(node, BinaryExpr):
-            self._visit_binary(node)
-        elif isinstance(node, UnaryExpr):
-            self._visit_unary(node)
-        elif isinstance(node, Literal):
-            self._visit_literal(node)
-        else:
-            pass
+        # literals are the most common leaf and need no handler call
+        kind = type(node)
+        if kind is Literal:
+            node.inferred_type = _LITERAL_TYPES[type(node.value)]
+            return
+
+        handler = self._expr_dispatch.get(kind)
+        if handler is not None:
+            handler(node)
 
     
     def _visit_var_expr(self, node: VarExpr):
         sym = self.scopes.lookup(node.name)
         if sym is None:
             self._error(f"Use of undeclared variable '{node.name}'", node)
-            node.inferred_type = Type.INT
+            node.inferred_type = _INT
             return
 
         node.inferred_type = sym.type
@@ -292,11 +340,11 @@ class SemanticAnalyzer:
         sym = self.scopes.lookup(node.fname)
         if sym is None:
             self._error(f"Call to undefined function '{node.fname}'", node)
-            node.inferred_type = Type.INT
+            node.inferred_type = _INT
             return
         elif sym.kind != SymbolKind.FUNC:
             self._error(f"'{node.fname}' is not a function", node)
-            node.inferred_type = Type.INT
+            node.inferred_type = _INT
             return
         else:
             node.inferred_type = sym.type   # return type
@@ -305,24 +353,20 @@ class SemanticAnalyzer:
         assert isinstance(fn, FunctionDef)
 
         if len(node.arguments) != len(fn.params):
-            self.errors.append(
-                SemanticError(
-                    f"Function '{node.fname}' expects {len(fn.params)} arguments, "
-                    f"but got {len(node.arguments)}",
-                    node
-                )
+            self._error(
+                f"Function '{node.fname}' expects {len(fn.params)} arguments, "
+                f"but got {len(node.arguments)}",
+                node
             )
         
-        min_len = min(len(node.arguments), len(fn.params))
-        for arg, param in zip(node.arguments[:min_len], fn.params[:min_len]):
+        param_types = self._signature(fn)[1]
+        for arg, param, ptype in zip(node.arguments, fn.params, param_types):
             if arg.inferred_type is None:
-                arg.inferred_type = Type.INT  # recovery
-            if self._map_type(param.type) != arg.inferred_type:
-                self.errors.append(
-                    SemanticError(
-                        f"Argument type mismatch: expected {param.type}, got {self._unmap_type(arg.inferred_type)}",
-                        arg
-                    )
+                arg.inferred_type = _INT  # recovery
+            if ptype != arg.inferred_type:
+                self._error(
+                    f"Argument type mismatch: expected {param.type}, got {self._unmap_type(arg.inferred_type)}",
+                    arg
                 )
 
 
@@ -335,79 +379,80 @@ class SemanticAnalyzer:
         lt = node.left.inferred_type
         rt = node.right.inferred_type
         op = node.op
+        INT = _INT
+        BOOL = _BOOL
 
         # arithmetic
-        if op in {"+", "-", "*", "/"}:
-            if lt == Type.INT and rt == Type.INT:
-                node.inferred_type = Type.INT
-            else:
+        if op in _ARITH_OPS:
+            if not (lt == INT and rt == INT):
                 self._error(f"Arithmetic operator '{op}' requires int operands", node)
-                node.inferred_type = Type.INT
+            node.inferred_type = INT
 
         # relational
-        elif op in {"<", ">", "<=", ">="}:
-            if lt == Type.INT and rt == Type.INT:
-                node.inferred_type = Type.BOOL
-            else:
+        elif op in _RELATIONAL_OPS:
+            if not (lt == INT and rt == INT):
                 self._error(f"Relational operator '{op}' requires int operands", node)
-                node.inferred_type = Type.BOOL
+            node.inferred_type = BOOL
 
         # equality
-        elif op in {"==", "!="}:
-            if lt == rt:
-                node.inferred_type = Type.BOOL
-            else:
+        elif op in _EQUALITY_OPS:
+            if lt != rt:
                 self._error(f"Equality operator '{op}' requires operands of same type", node)
-                node.inferred_type = Type.BOOL
+            node.inferred_type = BOOL
 
         # logical
-        elif op in {"&&", "||"}:
-            if lt == Type.BOOL and rt == Type.BOOL:
-                node.inferred_type = Type.BOOL
-            else:
+        elif op in _LOGICAL_OPS:
+            if not (lt == BOOL and rt == BOOL):
                 self._error(f"Logical operator '{op}' requires bool operands", node)
-                node.inferred_type = Type.BOOL
+            node.inferred_type = BOOL
 
         else:
             self._error(f"Unknown binary operator '{op}'", node)
-            node.inferred_type = Type.INT
+            node.inferred_type = INT
 
 
     def _visit_unary(self, node: UnaryExpr):
         self._visit_expr(node.right)
         t = node.right.inferred_type
+        op = node.op
 
-        if node.op == "-" and t == Type.INT:
-            node.inferred_type = Type.INT
-        elif node.op == "!" and (t == Type.BOOL or t == Type.INT):
-            node.inferred_type = Type.BOOL
+        if op == "-" and t == _INT:
+            node.inferred_type = _INT
+        elif op == "!" and (t == _BOOL or t == _INT):
+            node.inferred_type = _BOOL
         else:
-            self._error(f"Invalid operand type for '{node.op}'", node)
-            node.inferred_type = Type.INT   # dummy
-    
-    def _visit_literal(self, node: Literal):
-        if isinstance(node.value, bool):
-            node.inferred_type = Type.BOOL
-        else:
-            node.inferred_type = Type.INT
+            self._error(f"Invalid operand type for '{op}'", node)
+            node.inferred_type = _INT   # dummy
 
     # -------------------------
     # Helpers
     # -------------------------
 
     def _error(self, message: str, node: ASTNode):
-        self.errors.append(SemanticError(message, node))
+        self._errors.append((message, node))
+
+    def _signature(self, fn: FunctionDef) -> Tuple[Type, Tuple[Type, ...]]:
+        """
+        Mapped return and parameter types of fn, computed once per
+        function and shared by its declaration, body and call sites.
+        """
+        sig = self._signatures.get(id(fn))
+        if sig is None:
+            sig = (
+                self._map_type(fn.return_type),
+                tuple(self._map_type(p.type) for p in fn.params),
+            )
+            self._signatures[id(fn)] = sig
+        return sig
 
     def _map_type(self, t: str) -> Type:
-        if t == "int":
-            return Type.INT
-        elif t == "bool":
-            return Type.BOOL
-        else:
-            raise RuntimeError(f"Unknown type {t}")
+        try:
+            return _TYPE_MAP[t]
+        except KeyError:
+            raise RuntimeError(f"Unknown type {t}") from None
         
     def _unmap_type(self, t: Type) -> str:
-        if t == Type.INT:
+        if t == _INT:
             return "int"
         else:
             return "bool"
\ No newline at end of file
@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum, auto
-from typing import Dict, Optional, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ast_nodes import ASTNode
@@ -27,7 +27,7 @@ class Type(Enum):
 # Symbol
 # ---------------------------
 
-@dataclass
+@dataclass(slots=True)
 class Symbol:
     """
     Represents a named entity in the program:
@@ -39,51 +39,6 @@ class Symbol:
     decl_node: "ASTNode"   # reference to declaration AST node
 
 
-# ---------------------------
-# Scope
-# ---------------------------
-
-class Scope:
-    """
-    A single lexical scope.
-    Holds a mapping from names to symbols
-    and a link to the parent scope.
-    """
-
-    def __init__(self, parent: Optional["Scope"] = None):
-        self.parent: Optional["Scope"] = parent
-        self.symbols: Dict[str, Symbol] = {}
-
-    # ----- definition -----
-
-    def define(self, sym: Symbol) -> None:
-        """
-        Define a symbol in the current scope.
-        Assumes redeclaration checks are done by caller.
-        """
-        self.symbols[sym.name] = sym
-
-    # ----- lookup -----
-
-    def lookup_current(self, name: str) -> Optional[Symbol]:
-        """
-        Look up a name only in this scope.
-        """
-        return self.symbols.get(name)
-
-    def lookup(self, name: str) -> Optional[Symbol]:
-        """
-        Look up a name in this scope and all parent scopes.
-        """
-        scope = self
-        while scope is not None:
-            sym = scope.symbols.get(name)
-            if sym is not None:
-                return sym
-            scope = scope.parent
-        return None
-
-
 # ---------------------------
 # Scope stack helper
 # ---------------------------
@@ -91,10 +46,22 @@ class Scope:
 class ScopeStack:
     """
     Manages a stack of scopes for semantic analysis.
+
+    All visible bindings live in one dict, so lookup is a single probe.
+    Defining a name records what it shadowed in an undo log, and
+    popping a scope replays the log back to where the scope started.
     """
 
     def __init__(self):
-        self.current: Optional[Scope] = None
+        # name -> innermost visible symbol, and the depth it was defined at
+        self.symbols: Dict[str, Symbol] = {}
+        self._depths: Dict[str, int] = {}
+
+        # (name, shadowed symbol, its depth); symbol is None if unbound
+        self._undo: List[Tuple[str, Optional[Symbol], int]] = []
+
+        # undo-log length at the start of each open scope
+        self._marks: List[int] = []
 
     # ----- scope control -----
 
@@ -102,29 +69,41 @@ class ScopeStack:
         """
         Create a new scope on top of the stack.
         """
-        self.current = Scope(parent=self.current)
+        self._marks.append(len(self._undo))
 
     def pop_scope(self) -> None:
         """
         Pop the current scope.
         """
-        if self.current is None:
+        if not self._marks:
             raise RuntimeError("No scope to pop")
-        self.current = self.current.parent
+
+        mark = self._marks.pop()
+        undo = self._undo
+        while len(undo) > mark:
+            name, prev, depth = undo.pop()
+            if prev is None:
+                del self.symbols[name]
+                del self._depths[name]
+            else:
+                self.symbols[name] = prev
+                self._depths[name] = depth
 
     # ----- symbol ops -----
 
     def define(self, sym: Symbol) -> None:
-        if self.current is None:
+        if not self._marks:
             raise RuntimeError("No active scope")
-        self.current.define(sym)
+
+        name = sym.name
+        self._undo.append((name, self.symbols.get(name), self._depths.get(name, 0)))
+        self.symbols[name] = sym
+        self._depths[name] = len(self._marks)
 
     def lookup(self, name: str) -> Optional[Symbol]:
-        if self.current is None:
-            return None
-        return self.current.lookup(name)
+        return self.symbols.get(name)
 
     def lookup_current(self, name: str) -> Optional[Symbol]:
-        if self.current is None:
+        if self._depths.get(name) != len(self._marks):
             return None
-        return self.current.lookup_current(name)
+        return self.symbols[name]
@@ -1,6 +1,7 @@
+from array import array
 from enum import Enum, auto
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, List, NamedTuple
 
 class TokenType(Enum):
     # Keywords
@@ -47,13 +48,23 @@ class TokenType(Enum):
     # End of file
     EOF = auto()
 
-@dataclass
+@dataclass(slots=True)
 class Token:
     type: TokenType
     value: Any
     line: int
     column: int
 
+class TokenColumns(NamedTuple):
+    """
+    A token stream stored column-wise: token i is
+    (TokenType(kinds[i]), values[i], lines[i], columns[i]).
+    """
+    kinds: array      # "B": TokenType values
+    values: List[Any]
+    lines: array      # "I"
+    columns: array    # "I"
+
 KEYWORDS = {
     "int": TokenType.INT,
     "bool": TokenType.BOOL,
@@ -64,4 +75,30 @@ KEYWORDS = {
     "print": TokenType.PRINT,
     "true": TokenType.TRUE,
     "false": TokenType.FALSE,
-}
\ No newline at end of file
+}
+
+OPERATORS = {
+    # two-character operators
+    "==": TokenType.EQEQ,
+    "!=": TokenType.NEQ,
+    "<=": TokenType.LE,
+    ">=": TokenType.GE,
+    "&&": TokenType.ANDAND,
+    "||": TokenType.OROR,
+
+    # single-character operators & delimiters
+    "+": TokenType.PLUS,
+    "-": TokenType.MINUS,
+    "*": TokenType.STAR,
+    "/": TokenType.SLASH,
+    "=": TokenType.EQ,
+    "<": TokenType.LT,
+    ">": TokenType.GT,
+    "!": TokenType.NOT,
+    "(": TokenType.LPAREN,
+    ")": TokenType.RPAREN,
+    "{": TokenType.LBRACE,
+    "}": TokenType.RBRACE,
+    ";": TokenType.SEMI,
+    ",": TokenType.COMMA,
+}
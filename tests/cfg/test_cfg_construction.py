@@ -47,26 +47,26 @@ def has_cycle(cfg):
     Detects whether the CFG contains a cycle
     (used to test loop construction).
     """
-    visited = set()
-    stack = set()
-
-    def dfs(block):
-        if block in stack:
+    visited = {cfg.entry}
+    on_stack = {cfg.entry}
+    stack = [(cfg.entry, iter(cfg.entry.successors))]
+
+    while stack:
+        block, succs = stack[-1]
+        succ = next(succs, None)
+        if succ is None:
+            stack.pop()
+            on_stack.discard(block)
+            continue
+
+        if succ in on_stack:
             return True
-        if block in visited:
-            return False
-
-        visited.add(block)
-        stack.add(block)
-
-        for succ in block.successors:
-            if dfs(succ):
-                return True
-
-        stack.remove(block)
-        return False
+        if succ not in visited:
+            visited.add(succ)
+            on_stack.add(succ)
+            stack.append((succ, iter(succ.successors)))
 
-    return dfs(cfg.entry)
+    return False
 
 
 # -------------------------------------------------
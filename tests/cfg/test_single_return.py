@@ -0,0 +1,128 @@
+import os
+import sys
+
+# -------------------------------------------------
+# Make project root importable
+# -------------------------------------------------
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+SRC = os.path.join(ROOT, "src")
+sys.path.insert(0, SRC)
+
+from lexer import Lexer
+from parser import Parser
+from cfg import CFGBuilder
+from cfg_analysis import (
+    CFGDeadStoreAnalyzer,
+    CFGDefiniteAssignmentAnalyzer,
+    CFGUnreachableAnalyzer,
+    CFGZeroAnalysis,
+    is_single_return,
+    single_return_diagnostics,
+)
+
+
+# -------------------------------------------------
+# Helpers
+# -------------------------------------------------
+
+def parse_single_function(source):
+    tokens = Lexer(source).tokenize()
+    program = Parser(tokens).parse()
+
+    assert len(program.functions) == 1, (
+        "single-return tests expect exactly one function"
+    )
+
+    return program.functions[0]
+
+
+def cfg_diagnostics(fn):
+    """
+    What the CFG analyses report for fn, in pipeline order.
+    """
+    cfg, always_returns = CFGBuilder().build_and_check(fn.body)
+    messages = [] if always_returns else ["may not return"]
+
+    ua = CFGUnreachableAnalyzer(cfg)
+    for block in ua.unreachable_blocks():
+        messages.extend("Unreachable code" for _ in block.statements)
+
+    da = CFGDefiniteAssignmentAnalyzer(cfg, fn.params)
+    da.analyze()
+    da.check_uses()
+    messages.extend(str(e) for e in da.errors)
+
+    ds = CFGDeadStoreAnalyzer(cfg)
+    ds.analyze()
+    messages.extend("Dead store" for _ in ds.dead_stores)
+
+    zero = CFGZeroAnalysis(cfg)
+    zero.analyze()
+    messages.extend(str(e) for e in zero.errors)
+
+    return messages
+
+
+def assert_paths_agree(source):
+    fn = parse_single_function(source)
+    assert is_single_return(fn.body), "not a single-return body"
+
+    fast = [str(e) for e in single_return_diagnostics(fn.body.statements[0], fn.params)]
+    slow = cfg_diagnostics(fn)
+
+    assert fast == slow, f"fast path {fast} != CFG path {slow}"
+
+
+# -------------------------------------------------
+# Fast path vs CFG path
+# -------------------------------------------------
+
+def test_parameters_assigned():
+    assert_paths_agree("int f(int a, int b) { return a + b; }")
+
+
+def test_local_unassigned():
+    assert_paths_agree("int f(int a) { return a + x; }")
+
+
+def test_division_by_variable():
+    assert_paths_agree("int f(int a, int b) { return a / b + b / (a / 2); }")
+
+
+def test_duplicate_parameters():
+    assert_paths_agree("int f(int a, int a) { return a; }")
+    assert_paths_agree("int f(int a, int a, int b) { return a + b + c; }")
+
+
+# -------------------------------------------------
+# Main: Run all tests
+# -------------------------------------------------
+
+if __name__ == "__main__":
+    tests = [
+        ("Parameters Assigned", test_parameters_assigned),
+        ("Local Unassigned", test_local_unassigned),
+        ("Division By Variable", test_division_by_variable),
+        ("Duplicate Parameters", test_duplicate_parameters),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for name, test_func in tests:
+        try:
+            test_func()
+            print(f"✓ {name}")
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ {name}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ {name}: Unexpected error: {e}")
+            failed += 1
+
+    print("==============================")
+    print(f"Results: {passed} passed, {failed} failed")
+
+    # Exit with non-zero code if any tests failed
+    sys.exit(0 if failed == 0 else 1)
@@ -1,5 +1,8 @@
 import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple
 
 ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
 SRC = os.path.join(ROOT, "src")
@@ -15,6 +18,9 @@ from pipeline import analyze_source
 TEST_EXT = ".mc"
 EXPECT_PREFIX = "// EXPECT:"
 
+# an EXPECT directive on a line of its own, captured up to end of line
+_EXPECT_RE = re.compile(r"^[ \t]*" + re.escape(EXPECT_PREFIX) + r"(.*)$", re.M)
+
 # Default test directory relative to this script
 DEFAULT_TEST_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 
@@ -31,20 +37,16 @@ def extract_expectations(source: str):
     Extract EXPECT directives from source.
     Returns a list of expected strings.
     """
-    expects = []
-    for line in source.splitlines():
-        line = line.strip()
-        if line.startswith(EXPECT_PREFIX):
-            expects.append(line[len(EXPECT_PREFIX):].strip())
-    return expects
+    return [e.strip() for e in _EXPECT_RE.findall(source)]
 
 
-def run_single_test(path: str) -> bool:
+def run_single_test(path: str) -> Tuple[bool, List[str]]:
     """
     Run analyzer on one file and compare diagnostics.
-    Returns True if test passes, False otherwise.
+    Returns (passed, report lines); the caller prints the report so
+    tests can run in worker processes without interleaving output.
     """
-    print(f"=== Analyzing {path} ===")
+    log = [f"=== Analyzing {path} ==="]
 
     with open(path) as f:
         source = f.read()
@@ -59,25 +61,25 @@ def run_single_test(path: str) -> bool:
     # Test specification error
     # -------------------------
     if not expected:
-        print("❌ TEST ERROR: no EXPECT directives found")
+        log.append("❌ TEST ERROR: no EXPECT directives found")
         if actual:
-            print("Analyzer produced diagnostics:")
+            log.append("Analyzer produced diagnostics:")
             for a in actual:
-                print(f"  {a}")
-        return False
+                log.append(f"  {a}")
+        return False, log
 
     # -------------------------
     # EXPECT: OK
     # -------------------------
     if expected == ["OK"]:
         if actual:
-            print("❌ FAIL: expected no diagnostics, but got:")
+            log.append("❌ FAIL: expected no diagnostics, but got:")
             for a in actual:
-                print(f"  {a}")
-            return False
+                log.append(f"  {a}")
+            return False, log
 
-        print("✅ PASS")
-        return True
+        log.append("✅ PASS")
+        return True, log
 
     # -------------------------
     # Error expectation matching
@@ -89,32 +91,35 @@ def run_single_test(path: str) -> bool:
     unexpected = []
 
     # Check if each expected string appears as a substring in at least one actual diagnostic
+    # (expectations are single lines, so none can match across the "\n" joins)
+    all_actual = "\n".join(actual_lower)
     for i, e in enumerate(expected_norm):
-        if not any(e in a_lower for a_lower in actual_lower):
+        if e not in all_actual:
             missing.append(expected[i].strip())  # Show original case in error message
 
     # Check if each actual diagnostic matches at least one expected pattern
+    any_expected = re.compile("|".join(re.escape(e) for e in expected_norm))
     for i, a_lower in enumerate(actual_lower):
-        if not any(e in a_lower for e in expected_norm):
+        if not any_expected.search(a_lower):
             unexpected.append(actual[i])  # Show original case in error message
 
     if missing or unexpected:
-        print("❌ FAIL")
+        log.append("❌ FAIL")
 
         if missing:
-            print("Missing expected diagnostics:")
+            log.append("Missing expected diagnostics:")
             for m in missing:
-                print(f"  {m}")
+                log.append(f"  {m}")
 
         if unexpected:
-            print("Unexpected diagnostics:")
+            log.append("Unexpected diagnostics:")
             for u in unexpected:
-                print(f"  {u}")
+                log.append(f"  {u}")
 
-        return False
+        return False, log
 
-    print("✅ PASS")
-    return True
+    log.append("✅ PASS")
+    return True, log
 
 def should_skip_directory(dirpath: str) -> bool:
     """
@@ -129,8 +134,7 @@ def run_tests(root: str):
     Run all tests under root directory.
     Returns (total_tests, failed_tests).
     """
-    total = 0
-    failures = 0
+    paths = []
 
     for dirpath, dirnames, filenames in os.walk(root):
         # Skip excluded directories
@@ -142,10 +146,19 @@ def run_tests(root: str):
         
         for name in filenames:
             if name.endswith(TEST_EXT):
-                total += 1
-                path = os.path.join(dirpath, name)
-                if not run_single_test(path):
-                    failures += 1
+                paths.append(os.path.join(dirpath, name))
+
+    # Tests are independent; run them across processes and report
+    # in discovery order.
+    with ProcessPoolExecutor() as ex:
+        results = list(ex.map(run_single_test, paths))
+
+    total = len(paths)
+    failures = 0
+    for passed, log in results:
+        print("\n".join(log))
+        if not passed:
+            failures += 1
 
     return total, failures
 
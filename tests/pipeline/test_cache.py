@@ -0,0 +1,199 @@
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+
+# -------------------------------------------------
+# Make project root importable
+# -------------------------------------------------
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+SRC = os.path.join(ROOT, "src")
+sys.path.insert(0, SRC)
+
+import pipeline
+from pipeline import AnalysisResult, analyze_file
+from semantic import Diagnostic
+
+
+# -------------------------------------------------
+# Helpers
+# -------------------------------------------------
+
+SOURCE = """
+int main() {
+    int x;
+    return x;
+}
+"""
+
+
+def write_program(directory):
+    path = os.path.join(directory, "program.mc")
+    with open(path, "w") as f:
+        f.write(SOURCE)
+    return path
+
+
+def messages(result):
+    return [str(e) for e in result.errors]
+
+
+def cache_entries(directory):
+    return [n for n in os.listdir(directory) if n.endswith(".pkl")]
+
+
+def with_cache_dir(test):
+    """
+    Run test(work_dir, cache_dir) with CACHE_DIR pointed at a fresh
+    temporary directory.
+    """
+    def run():
+        saved = pipeline.CACHE_DIR
+        with tempfile.TemporaryDirectory() as work, tempfile.TemporaryDirectory() as cache:
+            pipeline.CACHE_DIR = cache
+            try:
+                test(work, cache)
+            finally:
+                pipeline.CACHE_DIR = saved
+    return run
+
+
+# -------------------------------------------------
+# Tests
+# -------------------------------------------------
+
+@with_cache_dir
+def test_cache_off_by_default(work, cache):
+    analyze_file(write_program(work))
+
+    assert cache_entries(cache) == [], "analyze_file wrote to the cache without use_cache"
+
+
+@with_cache_dir
+def test_cache_hit(work, cache):
+    path = write_program(work)
+    first = analyze_file(path, use_cache=True)
+
+    entries = cache_entries(cache)
+    assert len(entries) == 1, f"expected one cache entry, found {entries}"
+
+    # plant a recognisable result under the same key: a hit returns it
+    # instead of analyzing the file again
+    planted = AnalysisResult()
+    planted.errors.append(Diagnostic("from the cache"))
+    pipeline._cache_store(entries[0][:-len(".pkl")], planted)
+
+    second = analyze_file(path, use_cache=True)
+    assert messages(second) == ["from the cache"], "cache entry was not used"
+    assert messages(first) != ["from the cache"]
+
+
+@with_cache_dir
+def test_corrupt_entry_is_a_miss(work, cache):
+    path = write_program(work)
+    expected = messages(analyze_file(path))
+
+    analyze_file(path, use_cache=True)
+    entry = os.path.join(cache, cache_entries(cache)[0])
+
+    corrupt = [
+        b"",                                  # truncated
+        b"\x80\x05\x95garbage",               # bad pickle stream
+        b"cno_such_module\nthing\n.",         # ImportError on load
+        b"\x80\x04K\x01.",                    # a valid pickle of 1
+        pickle.dumps(("ab", "cd")),           # right shape, wrong contents
+    ]
+    for data in corrupt:
+        with open(entry, "wb") as f:
+            f.write(data)
+
+        result = analyze_file(path, use_cache=True)
+        assert messages(result) == expected, f"corrupt entry {data!r} changed the result"
+
+
+@with_cache_dir
+def test_hit_keeps_internal_errors(work, cache):
+    path = write_program(work)
+
+    def fail(self):
+        raise ValueError("boom")
+
+    saved = pipeline.CFGZeroAnalysis.analyze
+    pipeline.CFGZeroAnalysis.analyze = fail
+    try:
+        first = analyze_file(path, use_cache=True)
+    finally:
+        pipeline.CFGZeroAnalysis.analyze = saved
+
+    # served from the cache, so the patched analysis does not run again
+    second = analyze_file(path, use_cache=True)
+
+    expected = ["CFG error in function 'main': boom"]
+    assert first.internal_errors == expected, first.internal_errors
+    assert second.internal_errors == expected, "internal error lost on a cache hit"
+
+
+def run_cli(path, cache):
+    env = dict(os.environ, MINIC_CACHE_DIR=cache)
+    return subprocess.run(
+        [sys.executable, os.path.join(SRC, "pipeline.py"), "--cache", path],
+        env=env,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+@with_cache_dir
+def test_cli_and_library_share_entries(work, cache):
+    # an entry written by the CLI (where pipeline runs as __main__)
+    # is a hit for a library caller
+    path = write_program(work)
+    run_cli(path, cache)
+
+    entries = cache_entries(cache)
+    assert len(entries) == 1, f"expected one cache entry, found {entries}"
+    key = entries[0][:-len(".pkl")]
+    assert pipeline._cache_load(key) is not None, "library missed the CLI's entry"
+
+    # and the other way round
+    planted = AnalysisResult()
+    planted.errors.append(Diagnostic("from the cache"))
+    pipeline._cache_store(key, planted)
+
+    assert "from the cache" in run_cli(path, cache), "CLI missed the library's entry"
+
+
+# -------------------------------------------------
+# Main: Run all tests
+# -------------------------------------------------
+
+if __name__ == "__main__":
+    tests = [
+        ("Cache Off By Default", test_cache_off_by_default),
+        ("Cache Hit", test_cache_hit),
+        ("Corrupt Entry Is A Miss", test_corrupt_entry_is_a_miss),
+        ("Hit Keeps Internal Errors", test_hit_keeps_internal_errors),
+        ("CLI And Library Share Entries", test_cli_and_library_share_entries),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for name, test_func in tests:
+        try:
+            test_func()
+            print(f"✓ {name}")
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ {name}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ {name}: Unexpected error: {e}")
+            failed += 1
+
+    print("==============================")
+    print(f"Results: {passed} passed, {failed} failed")
+
+    # Exit with non-zero code if any tests failed
+    sys.exit(0 if failed == 0 else 1)
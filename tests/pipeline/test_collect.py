@@ -0,0 +1,118 @@
+import os
+import sys
+import tempfile
+
+# -------------------------------------------------
+# Make project root importable
+# -------------------------------------------------
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+SRC = os.path.join(ROOT, "src")
+sys.path.insert(0, SRC)
+
+import pipeline
+from pipeline import collect_mc_files
+
+
+# -------------------------------------------------
+# Helpers
+# -------------------------------------------------
+
+def make_tree(root, files):
+    """
+    Create empty files at the given paths (relative to root).
+    """
+    for rel in files:
+        path = os.path.join(root, rel)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        open(path, "w").close()
+
+
+def relative(root, paths):
+    return [os.path.relpath(p, root) for p in paths]
+
+
+# -------------------------------------------------
+# Tests
+# -------------------------------------------------
+
+def test_collects_sorted_mc_files():
+    with tempfile.TemporaryDirectory() as root:
+        make_tree(root, ["b.mc", "a/z.mc", "a/notes.txt", "a/b/c.mc"])
+
+        found = relative(root, collect_mc_files(root))
+        assert found == ["a/b/c.mc", "a/z.mc", "b.mc"], found
+
+
+def test_single_file():
+    with tempfile.TemporaryDirectory() as root:
+        make_tree(root, ["one.mc", "notes.txt"])
+
+        found = collect_mc_files(os.path.join(root, "one.mc"))
+        assert relative(root, found) == ["one.mc"], found
+        assert collect_mc_files(os.path.join(root, "notes.txt")) == []
+
+
+def test_skips_hidden_entries():
+    with tempfile.TemporaryDirectory() as root:
+        make_tree(root, ["kept.mc", ".git/objects/x.mc", ".hidden.mc", "sub/.cache/y.mc"])
+
+        found = relative(root, collect_mc_files(root))
+        assert found == ["kept.mc"], found
+
+
+def test_skips_unreadable_directory():
+    with tempfile.TemporaryDirectory() as root:
+        make_tree(root, ["kept.mc", "locked/lost.mc", "open/also_kept.mc"])
+        locked = os.path.join(root, "locked")
+
+        os.chmod(locked, 0)
+        saved = pipeline.os.scandir
+        if os.access(locked, os.R_OK):
+            # running as root, where mode 000 does not stop reads
+            def scandir(path):
+                if path == locked:
+                    raise PermissionError(13, "Permission denied", path)
+                return saved(path)
+            pipeline.os.scandir = scandir
+
+        try:
+            found = relative(root, collect_mc_files(root))
+        finally:
+            pipeline.os.scandir = saved
+            os.chmod(locked, 0o755)
+
+        assert found == ["kept.mc", "open/also_kept.mc"], found
+
+
+# -------------------------------------------------
+# Main: Run all tests
+# -------------------------------------------------
+
+if __name__ == "__main__":
+    tests = [
+        ("Collects Sorted .mc Files", test_collects_sorted_mc_files),
+        ("Single File", test_single_file),
+        ("Skips Hidden Entries", test_skips_hidden_entries),
+        ("Skips Unreadable Directory", test_skips_unreadable_directory),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for name, test_func in tests:
+        try:
+            test_func()
+            print(f"✓ {name}")
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ {name}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ {name}: Unexpected error: {e}")
+            failed += 1
+
+    print("==============================")
+    print(f"Results: {passed} passed, {failed} failed")
+
+    # Exit with non-zero code if any tests failed
+    sys.exit(0 if failed == 0 else 1)
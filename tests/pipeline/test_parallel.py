@@ -0,0 +1,166 @@
+import os
+import sys
+import tempfile
+
+# -------------------------------------------------
+# Make project root importable
+# -------------------------------------------------
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "../../"))
+SRC = os.path.join(ROOT, "src")
+sys.path.insert(0, SRC)
+
+import pipeline
+from pipeline import analyze_file, analyze_files
+
+
+# -------------------------------------------------
+# Helpers
+# -------------------------------------------------
+
+PROGRAMS = {
+    "clean.mc": """
+int main() {
+    return 0;
+}
+""",
+    "unassigned.mc": """
+int main() {
+    int x;
+    return x;
+}
+""",
+    "dead_store.mc": """
+int main() {
+    int x = 1;
+    x = 2;
+    return 0;
+}
+""",
+}
+
+# a left-chained expression deep enough that pickling its AST
+# overflows the recursion limit
+DEEP_TERMS = 300
+
+DEEP_PROGRAM = f"""
+int main() {{
+    int a = 1;
+    int x = {" + ".join(["a"] * DEEP_TERMS)};
+    return 0;
+}}
+"""
+
+
+def write_programs(directory, programs):
+    paths = []
+    for name, source in sorted(programs.items()):
+        path = os.path.join(directory, name)
+        with open(path, "w") as f:
+            f.write(source)
+        paths.append(path)
+    return paths
+
+
+def messages(result):
+    return [str(e) for e in result.errors]
+
+
+# -------------------------------------------------
+# Tests
+# -------------------------------------------------
+
+def test_matches_sequential():
+    with tempfile.TemporaryDirectory() as work:
+        paths = write_programs(work, PROGRAMS)
+
+        results = list(analyze_files(paths))
+        assert len(results) == len(paths)
+
+        for path, (result, error) in zip(paths, results):
+            assert error is None, f"{path}: {error}"
+            assert messages(result) == messages(analyze_file(path)), path
+
+
+def test_deep_expression():
+    with tempfile.TemporaryDirectory() as work:
+        programs = dict(PROGRAMS, **{"deep.mc": DEEP_PROGRAM})
+        paths = write_programs(work, programs)
+
+        results = dict(zip(paths, analyze_files(paths)))
+
+        result, error = results[os.path.join(work, "deep.mc")]
+        assert error is None, f"deep expression failed: {error}"
+        assert messages(result) == ["Dead store at SourcePos(line=4, column=5)"], messages(result)
+
+        result, error = results[os.path.join(work, "clean.mc")]
+        assert error is None and messages(result) == [], "other files were affected"
+
+
+def test_failure_stays_with_its_file():
+    with tempfile.TemporaryDirectory() as work:
+        paths = write_programs(work, PROGRAMS)
+        missing = os.path.join(work, "missing.mc")
+
+        results = list(analyze_files([missing] + paths))
+
+        result, error = results[0]
+        assert result is None and isinstance(error, OSError), (result, error)
+        for path, (result, error) in zip(paths, results[1:]):
+            assert error is None, f"{path}: {error}"
+
+
+def test_pool_capped_at_file_count():
+    seen = []
+
+    class RecordingExecutor(pipeline.ProcessPoolExecutor):
+        def __init__(self, max_workers):
+            seen.append(max_workers)
+            super().__init__(max_workers)
+
+    saved_executor = pipeline.ProcessPoolExecutor
+    saved_cpu_count = pipeline.os.cpu_count
+    pipeline.ProcessPoolExecutor = RecordingExecutor
+    pipeline.os.cpu_count = lambda: 64
+    try:
+        with tempfile.TemporaryDirectory() as work:
+            paths = write_programs(work, PROGRAMS)
+            list(analyze_files(paths))
+    finally:
+        pipeline.ProcessPoolExecutor = saved_executor
+        pipeline.os.cpu_count = saved_cpu_count
+
+    assert seen == [len(PROGRAMS)], f"started pools of {seen} workers"
+
+
+# -------------------------------------------------
+# Main: Run all tests
+# -------------------------------------------------
+
+if __name__ == "__main__":
+    tests = [
+        ("Matches Sequential", test_matches_sequential),
+        ("Deep Expression", test_deep_expression),
+        ("Failure Stays With Its File", test_failure_stays_with_its_file),
+        ("Pool Capped At File Count", test_pool_capped_at_file_count),
+    ]
+
+    passed = 0
+    failed = 0
+
+    for name, test_func in tests:
+        try:
+            test_func()
+            print(f"✓ {name}")
+            passed += 1
+        except AssertionError as e:
+            print(f"✗ {name}: {e}")
+            failed += 1
+        except Exception as e:
+            print(f"✗ {name}: Unexpected error: {e}")
+            failed += 1
+
+    print("==============================")
+    print(f"Results: {passed} passed, {failed} failed")
+
+    # Exit with non-zero code if any tests failed
+    sys.exit(0 if failed == 0 else 1)
@@ -11,40 +11,70 @@ DIAGNOSTIC_RUNNER = os.path.join(
 
 CFG_TEST_RUNNER = "tests/cfg/test_cfg_construction.py"
 
+SINGLE_RETURN_TEST_RUNNER = "tests/cfg/test_single_return.py"
 
-def run_diagnostics():
-    print("\n==============================")
-    print("Running diagnostic tests")
-    print("==============================")
+CACHE_TEST_RUNNER = "tests/pipeline/test_cache.py"
+
+PARALLEL_TEST_RUNNER = "tests/pipeline/test_parallel.py"
+
+COLLECT_TEST_RUNNER = "tests/pipeline/test_collect.py"
 
-    result = subprocess.run(
-        [sys.executable, DIAGNOSTIC_RUNNER],
-        cwd=ROOT
+
+def start(runner):
+    """
+    Launch a test runner in the background, capturing its output.
+    """
+    return subprocess.Popen(
+        [sys.executable, runner],
+        cwd=ROOT,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
     )
 
-    return result.returncode == 0
 
+def finish(title, proc):
+    """
+    Wait for a runner started by start() and print its output.
+    """
+    output, _ = proc.communicate()
 
-def run_cfg_tests():
     print("\n==============================")
-    print("Running CFG construction tests")
+    print(title)
     print("==============================")
+    print(output, end="")
 
-    result = subprocess.run(
-        [sys.executable, CFG_TEST_RUNNER],
-        cwd=ROOT
-    )
-
-    return result.returncode == 0
+    return proc.returncode == 0
 
 
 def main():
+    # The suites are independent, so run them side by side and
+    # report them one after the other.
+    diagnostics = start(DIAGNOSTIC_RUNNER)
+    cfg_tests = start(CFG_TEST_RUNNER)
+    single_return_tests = start(SINGLE_RETURN_TEST_RUNNER)
+    cache_tests = start(CACHE_TEST_RUNNER)
+    parallel_tests = start(PARALLEL_TEST_RUNNER)
+    collect_tests = start(COLLECT_TEST_RUNNER)
+
     ok = True
 
-    if not run_diagnostics():
+    if not finish("Running diagnostic tests", diagnostics):
+        ok = False
+
+    if not finish("Running CFG construction tests", cfg_tests):
+        ok = False
+
+    if not finish("Running single-return fast path tests", single_return_tests):
+        ok = False
+
+    if not finish("Running result cache tests", cache_tests):
+        ok = False
+
+    if not finish("Running parallel analysis tests", parallel_tests):
         ok = False
 
-    if not run_cfg_tests():
+    if not finish("Running file collection tests", collect_tests):
         ok = False
 
     print("\n==============================")